@@ -25,6 +25,16 @@ def mock_response() -> AsyncMock:
     return response
 
 
+@pytest.fixture
+def mock_connect(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace TrestleWsClient's connect_websocket with an AsyncMock."""
+    mock = AsyncMock(return_value=AsyncMock())
+    monkeypatch.setattr(
+        "trestle_coordinator_core.transport.ws_client.connect_websocket", mock
+    )
+    return mock
+
+
 def create_mock_response(
     status: int = 200,
     json_data: dict[str, Any] | None = None,
@@ -13,9 +13,10 @@ Invariants tested:
 import ast
 import importlib
 import inspect
+import json
 import pkgutil
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, timedelta, timezone
 
 import pytest
 
@@ -33,6 +34,9 @@ from trestle_coordinator_core.adapter import (
     FactSink,
     FactType,
     IntentType,
+    encode_intent,
+    validate_fact,
+    validate_intent,
 )
 
 
@@ -78,6 +82,11 @@ class TestFactType:
         for ft in FactType:
             assert isinstance(ft.value, str)
 
+    def test_fact_types_hash_as_strings(self) -> None:
+        """Fact types compare and hash as their wire strings."""
+        assert FactType.PRESENCE == "presence"
+        assert hash(FactType.PRESENCE) == hash("presence")
+
     def test_fact_schemas_cover_all_types(self) -> None:
         """Every FactType has a schema defined."""
         for ft in FactType:
@@ -129,6 +138,16 @@ class TestCanonicalFact:
         assert fact.data == {}
         assert fact.confidence == 1.0
 
+    def test_fact_default_data_is_shared_and_read_only(self) -> None:
+        """Facts without data share one read-only empty mapping."""
+        now = datetime.now(UTC)
+        a = CanonicalFact(fact_type=FactType.MOTION, source_id="a", timestamp=now)
+        b = CanonicalFact(fact_type=FactType.MOTION, source_id="b", timestamp=now)
+
+        assert a.data is b.data
+        with pytest.raises(TypeError):
+            a.data["detected"] = True  # type: ignore[index]
+
     def test_fact_with_data(self) -> None:
         """CanonicalFact accepts arbitrary data payload."""
         fact = CanonicalFact(
@@ -687,6 +706,88 @@ class TestSchemaCompleteness:
         assert "persistent" in schema
 
 
+class TestSchemaValidation:
+    """Tests for validate_fact / validate_intent."""
+
+    def test_valid_fact_passes(self) -> None:
+        """Facts matching the schema validate; optional fields may be absent."""
+        fact = CanonicalFact(
+            fact_type=FactType.ENVIRONMENT,
+            source_id="living_room",
+            timestamp=datetime.now(tz=UTC),
+            data={"temperature": 21, "humidity": 40.5},
+        )
+        validate_fact(fact)
+
+    def test_fact_wrong_type_raises(self) -> None:
+        """A present field of the wrong type is rejected."""
+        fact = CanonicalFact(
+            fact_type=FactType.PRESENCE,
+            source_id="alice",
+            timestamp=datetime.now(tz=UTC),
+            data={"present": "yes"},
+        )
+        with pytest.raises(AdapterTranslationError, match="'present' must be bool"):
+            validate_fact(fact)
+
+    def test_intent_wrong_type_raises(self) -> None:
+        """Intent data is validated against INTENT_SCHEMAS."""
+        intent = CanonicalIntent(
+            intent_type=IntentType.ESCALATE,
+            target_id="alert-1",
+            timestamp=datetime.now(tz=UTC),
+            data={"alert_id": "alert-1", "from_level": 1, "to_level": "2"},
+        )
+        with pytest.raises(AdapterTranslationError, match="'to_level' must be int"):
+            validate_intent(intent)
+
+
+class TestIntentEncoding:
+    """Tests for encode_intent."""
+
+    def test_encode_intent_round_trips(self) -> None:
+        """Encoded intents are compact JSON with the canonical fields."""
+        ts = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
+        intent = CanonicalIntent(
+            intent_type=IntentType.INTERRUPT,
+            target_id="kitchen_display",
+            timestamp=ts,
+            data={"alert_id": "a1", "attention_level": "high", "outputs": ["audio"]},
+        )
+
+        decoded = json.loads(encode_intent(intent))
+
+        assert decoded == {
+            "type": "interrupt",
+            "target_id": "kitchen_display",
+            "ts": ts.isoformat(),
+            "data": {"alert_id": "a1", "attention_level": "high", "outputs": ["audio"]},
+            "priority": 50,
+            "idempotency_key": None,
+        }
+
+    def test_encode_intent_returns_utf8_bytes(self) -> None:
+        """Encoded intents are UTF-8 bytes keeping offsets and non-ASCII text."""
+        ts = datetime(2025, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=1)))
+        intent = CanonicalIntent(
+            intent_type=IntentType.ACTIVATE_OUTPUT,
+            target_id="hall_light",
+            timestamp=ts,
+            data={"channel": "visual", "intensity": "low", "label": "Café"},
+            priority=80,
+            idempotency_key="hall-1",
+        )
+
+        encoded = encode_intent(intent)
+
+        assert isinstance(encoded, bytes)
+        decoded = json.loads(encoded.decode("utf-8"))
+        assert decoded["ts"] == "2025-01-01T13:00:00+01:00"
+        assert decoded["data"]["label"] == "Café"
+        assert decoded["priority"] == 80
+        assert decoded["idempotency_key"] == "hall-1"
+
+
 class TestTranslationOnlyInvariant:
     """Tests that adapters should only translate, not arbitrate.
 
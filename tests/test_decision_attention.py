@@ -63,6 +63,13 @@ class TestAttentionLevelComparison:
         assert AttentionLevel.NOTIFY <= AttentionLevel.NOTIFY
         assert AttentionLevel.NOTIFY >= AttentionLevel.NOTIFY
 
+    def test_levels_are_ints(self) -> None:
+        """Levels are ints from PASSIVE=1 to CRITICAL=5."""
+        assert [int(level) for level in AttentionLevel] == [1, 2, 3, 4, 5]
+        assert max(AttentionLevel.GLANCE, AttentionLevel.INTERRUPT) is (
+            AttentionLevel.INTERRUPT
+        )
+
 
 class TestCriticalBypass:
     """Test Rule 1: Critical bypass for life-safety alerts."""
@@ -385,6 +392,19 @@ class TestDeterminism:
         contexts = {context1, context2}
         assert len(contexts) == 1
 
+    def test_equal_contexts_are_memoized(self) -> None:
+        """Equal contexts are served from the result cache."""
+        context = AttentionContext(alert_priority=77, escalation_level=2)
+        compute_attention_level(context)
+        hits = compute_attention_level.cache_info().hits
+
+        again = compute_attention_level(
+            AttentionContext(alert_priority=77, escalation_level=2)
+        )
+
+        assert again == AttentionLevel.CRITICAL
+        assert compute_attention_level.cache_info().hits == hits + 1
+
 
 class TestSafetyInvariants:
     """Test safety invariants that must never be violated."""
@@ -0,0 +1,253 @@
+"""Tests for alert realization decisions and their traces.
+
+Tests verify:
+- Suppression reasons (cooldown, quiet hours, disabled room)
+- Escalation (life safety, repeated triggers)
+- trace_decision reports the same outcome as realize_alert
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from trestle_coordinator_core.decision.realization import (
+    DecisionContext,
+    EscalationReason,
+    RealizationMode,
+    SuppressionReason,
+    realize_alert,
+    trace_decision,
+)
+
+NOW = datetime(2025, 1, 15, 23, 0)
+
+
+def make_context(**overrides: Any) -> DecisionContext:
+    """Build a decision context with sensible defaults."""
+    fields: dict[str, Any] = {
+        "alert_id": "alert-1",
+        "capability_id": "motion_alerts",
+        "domain": "motion",
+        "title": "Motion",
+        "message": "Motion detected",
+        "base_priority": 50,
+        "timestamp": NOW,
+        "current_time": NOW,
+    }
+    fields.update(overrides)
+    return DecisionContext(**fields)
+
+
+def assert_trace_matches(context: DecisionContext) -> None:
+    """The trace outcome equals the realize_alert outcome."""
+    result = realize_alert(context)
+    trace = trace_decision(context)
+
+    assert trace.realized == result.realized
+    assert trace.mode == result.mode.value
+    assert trace.computed_priority == result.computed_priority
+    assert trace.suppression_reasons == [r.value for r in result.suppression_reasons]
+    assert trace.escalation_reasons == [r.value for r in result.escalation_reasons]
+
+
+class TestTraceMatchesDecision:
+    """trace_decision explains the decision realize_alert actually makes."""
+
+    def test_cooldown_suppression(self) -> None:
+        """An alert inside its cooldown window is suppressed in both."""
+        context = make_context(
+            last_triggered=NOW - timedelta(seconds=10), cooldown_seconds=60
+        )
+
+        result = realize_alert(context)
+        assert result.realized is False
+        assert result.suppression_reasons == [SuppressionReason.COOLDOWN_ACTIVE]
+        assert_trace_matches(context)
+        assert "   → Cooldown: 10s of 60s elapsed" in trace_decision(context).steps
+
+    def test_quiet_hours_suppression(self) -> None:
+        """Opted-in quiet hours suppress a non-life-safety alert in both."""
+        context = make_context(
+            quiet_hours_preference=True,
+            quiet_hours_start="22:00",
+            quiet_hours_end="07:00",
+        )
+
+        result = realize_alert(context)
+        assert result.realized is False
+        assert result.suppression_reasons == [SuppressionReason.QUIET_HOURS]
+        assert_trace_matches(context)
+        assert trace_decision(context).in_quiet_hours is True
+
+    def test_life_safety_bypasses_quiet_hours(self) -> None:
+        """Life-safety alerts are realized during quiet hours in both."""
+        context = make_context(
+            base_priority=160,
+            quiet_hours_preference=True,
+            quiet_hours_start="22:00",
+            quiet_hours_end="07:00",
+        )
+
+        result = realize_alert(context)
+        assert result.realized is True
+        assert result.escalation_reasons == [EscalationReason.LIFE_SAFETY]
+        assert_trace_matches(context)
+
+    def test_disabled_room_suppression(self) -> None:
+        """A disabled room suppresses the alert in both."""
+        context = make_context(room_id="kitchen", room_policy={"enabled": False})
+
+        result = realize_alert(context)
+        assert result.realized is False
+        assert result.suppression_reasons == [SuppressionReason.ROOM_DISABLED]
+        assert_trace_matches(context)
+
+    def test_repeated_trigger_escalation(self) -> None:
+        """Repeated triggers escalate priority and mode in both."""
+        context = make_context(trigger_count=4)
+
+        result = realize_alert(context)
+        assert result.computed_priority == 90
+        assert result.mode == RealizationMode.BANNER
+        assert result.escalation_reasons == [EscalationReason.REPEATED_TRIGGER]
+        assert_trace_matches(context)
+
+        steps = trace_decision(context).steps
+        assert "   → Repeated triggers: 4, escalation=+40, computed=90" in steps
+        assert steps[-1] == "10. Mode selection: banner"
+
+    def test_capability_disabled_suppression(self) -> None:
+        """A disabled capability suppresses the alert in both."""
+        context = make_context(capability_enabled=False)
+
+        result = realize_alert(context)
+        assert result.suppression_reasons == [SuppressionReason.CAPABILITY_DISABLED]
+        assert_trace_matches(context)
+
+    def test_visibility_never_suppression(self) -> None:
+        """A "never" visibility preference suppresses the alert in both."""
+        context = make_context(visibility_preference="never")
+
+        result = realize_alert(context)
+        assert result.suppression_reasons == [SuppressionReason.USER_PREFERENCE_NEVER]
+        assert_trace_matches(context)
+
+    def test_alert_preference_disabled_suppression(self) -> None:
+        """A disabled alert preference suppresses the alert in both."""
+        context = make_context(alert_preference="disabled")
+
+        result = realize_alert(context)
+        assert result.suppression_reasons == [
+            SuppressionReason.ALERT_PREFERENCE_DISABLED
+        ]
+        assert_trace_matches(context)
+
+    def test_policy_disabled_suppression(self) -> None:
+        """A disabled policy suppresses the alert in both."""
+        context = make_context(policy_enabled=False)
+
+        result = realize_alert(context)
+        assert result.suppression_reasons == [SuppressionReason.DOMAIN_DISABLED]
+        assert_trace_matches(context)
+
+    def test_disabled_domain_suppression(self) -> None:
+        """A disabled domain policy suppresses the alert in both."""
+        context = make_context(domain_policy={"enabled": False})
+
+        result = realize_alert(context)
+        assert result.suppression_reasons == [SuppressionReason.DOMAIN_DISABLED]
+        assert_trace_matches(context)
+
+    def test_domain_boost_reaches_life_safety(self) -> None:
+        """A domain boost can lift an alert past the life-safety threshold."""
+        context = make_context(
+            base_priority=120,
+            domain_policy={"priority_boost": 40},
+            quiet_hours_preference=True,
+            quiet_hours_start="22:00",
+            quiet_hours_end="07:00",
+        )
+
+        result = realize_alert(context)
+        assert result.realized is True
+        assert result.computed_priority == 160
+        assert result.escalation_reasons == [EscalationReason.LIFE_SAFETY]
+        assert_trace_matches(context)
+
+    def test_quiet_hours_without_preference(self) -> None:
+        """Quiet hours do not suppress unless the user opted in."""
+        context = make_context(quiet_hours_start="22:00", quiet_hours_end="07:00")
+
+        result = realize_alert(context)
+        assert result.realized is True
+        assert_trace_matches(context)
+        assert trace_decision(context).in_quiet_hours is True
+
+    def test_early_suppression_still_reports_quiet_hours(self) -> None:
+        """The trace reports the quiet-hours window for early suppressions."""
+        context = make_context(
+            capability_enabled=False,
+            quiet_hours_start="22:00",
+            quiet_hours_end="07:00",
+        )
+
+        trace = trace_decision(context)
+        assert trace.realized is False
+        assert trace.in_quiet_hours is True
+
+    def test_cooldown_elapsed(self) -> None:
+        """An alert past its cooldown window is realized in both."""
+        context = make_context(
+            last_triggered=NOW - timedelta(seconds=90), cooldown_seconds=60
+        )
+
+        result = realize_alert(context)
+        assert result.realized is True
+        assert_trace_matches(context)
+
+    def test_trace_steps_follow_documented_numbering(self) -> None:
+        """A realized alert's trace runs steps 1-10 ending in mode selection."""
+        steps = trace_decision(make_context()).steps
+
+        assert [step.split(".", 1)[0] for step in steps] == [
+            str(number) for number in range(1, 11)
+        ]
+        assert steps[-1] == "10. Mode selection: banner"
+
+
+class TestPriorityAdjustments:
+    """priority_adjustments is only recorded when debug_trace is set."""
+
+    def test_empty_by_default(self) -> None:
+        """Without debug_trace the adjustments trail is not built."""
+        context = make_context(
+            base_priority=0, domain_policy={"priority_boost": 30}, trigger_count=3
+        )
+
+        assert realize_alert(context).priority_adjustments == []
+
+    def test_debug_trace_records_adjustments(self) -> None:
+        """With debug_trace every adjustment is recorded in order."""
+        context = make_context(
+            base_priority=0,
+            domain_policy={"priority_boost": 30},
+            trigger_count=3,
+            debug_trace=True,
+        )
+
+        result = realize_alert(context)
+        assert result.priority_adjustments == [
+            "base: 50",
+            "domain_boost: +30",
+            "escalation: +30",
+        ]
+        assert result.computed_priority == 110
+
+    def test_debug_trace_on_suppressed_result(self) -> None:
+        """Suppressed results keep the trail recorded so far."""
+        context = make_context(capability_enabled=False, debug_trace=True)
+
+        result = realize_alert(context)
+        assert result.realized is False
+        assert result.priority_adjustments == ["base: 50", "alert_base: 50"]
@@ -15,6 +15,7 @@ from trestle_coordinator_core.decision.realization_intent import (
     OutputChannel,
     RealizationIntent,
     produce_realization_frame,
+    produce_realization_frame_bytes,
     realize_attention,
 )
 from trestle_coordinator_core.decision.selection import DeviceContext
@@ -398,6 +399,13 @@ class TestDeterminism:
                 OutputChannel.HAPTIC,
             ]
 
+    def test_mutating_result_does_not_leak(self) -> None:
+        """Each call returns a fresh list, even though results are precomputed."""
+        device = device_with_all_capabilities()
+        intents = realize_attention(AttentionLevel.NOTIFY, device)
+        intents.clear()
+        assert len(realize_attention(AttentionLevel.NOTIFY, device)) == 2
+
 
 # --------------------------------------------------------------------------
 # Test: ICD Frame Production
@@ -450,6 +458,16 @@ class TestProduceRealizationFrame:
         )
         assert frame["outputs"] == []
 
+    def test_mutating_frame_does_not_leak(self) -> None:
+        """Frame outputs are fresh dicts, even for the static profile intents."""
+        device = device_with_all_capabilities()
+        intents = realize_attention(AttentionLevel.NOTIFY, device)
+        frame = produce_realization_frame("a", AttentionLevel.NOTIFY, intents)
+        frame["outputs"][0]["intensity"] = "changed"
+
+        again = produce_realization_frame("b", AttentionLevel.NOTIFY, intents)
+        assert again["outputs"][0]["intensity"] == intents[0].intensity
+
     def test_frame_is_serializable(self) -> None:
         """Frame is JSON-serializable (no complex objects)."""
         import json
@@ -465,6 +483,22 @@ class TestProduceRealizationFrame:
         json_str = json.dumps(frame)
         assert isinstance(json_str, str)
 
+    def test_frame_bytes_match_frame(self) -> None:
+        """Encoded frame decodes back to the dict frame."""
+        import json
+
+        device = device_with_all_capabilities()
+        intents = realize_attention(AttentionLevel.NOTIFY, device)
+        data = produce_realization_frame_bytes(
+            alert_id="bytes-test",
+            attention=AttentionLevel.NOTIFY,
+            intents=intents,
+        )
+        assert isinstance(data, bytes)
+        assert json.loads(data) == produce_realization_frame(
+            "bytes-test", AttentionLevel.NOTIFY, intents
+        )
+
 
 # --------------------------------------------------------------------------
 # Test: Edge Cases
@@ -17,6 +17,7 @@ from trestle_coordinator_core.decision.selection import (
     DeviceCapabilities,
     DeviceContext,
     select_device,
+    select_devices_batch,
 )
 
 
@@ -774,3 +775,50 @@ class TestRecentlyActiveSignal:
 
         assert result.device_id == "device"
         assert "recently_active" not in result.score_breakdown
+
+
+class TestSelectDevicesBatch:
+    """Tests for batch selection over a shared device pool."""
+
+    def test_matches_per_target_selection(self) -> None:
+        """Each batch result equals select_device for the same target."""
+        current_time = 1000.0
+
+        devices = [
+            DeviceContext(device_id="kitchen", room="kitchen", online=True),
+            DeviceContext(
+                device_id="hall",
+                room="hall",
+                online=True,
+                last_interaction_ts=current_time - 10,
+            ),
+            DeviceContext(device_id="office", room="office", online=False),
+        ]
+        capabilities = {
+            "kitchen": DeviceCapabilities(
+                device_id="kitchen", capabilities=frozenset({"audio"})
+            ),
+            "hall": DeviceCapabilities(device_id="hall"),
+            "office": DeviceCapabilities(device_id="office"),
+        }
+        targets = [
+            AlertTarget(room_id="kitchen"),
+            AlertTarget(room_id="hall"),
+            AlertTarget(required_capabilities=frozenset({"audio"})),
+            AlertTarget(excluded_devices=frozenset({"kitchen", "hall"})),
+        ]
+
+        results = select_devices_batch(targets, devices, capabilities, current_time)
+
+        assert results == [
+            select_device(target, devices, capabilities, current_time)
+            for target in targets
+        ]
+        assert [r.device_id for r in results] == ["kitchen", "hall", "kitchen", None]
+
+    def test_empty_targets(self) -> None:
+        """No targets yields no results."""
+        device = DeviceContext(device_id="device", online=True)
+        capabilities = {"device": DeviceCapabilities(device_id="device")}
+
+        assert select_devices_batch([], [device], capabilities, 1000.0) == []
@@ -79,6 +79,30 @@ class TestOrphanPanelRecovery:
         second_call_kwargs = mock_session.get.call_args_list[1].kwargs
         assert second_call_kwargs["headers"] == {}
 
+    async def test_stored_secret_headers_are_read_only(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test the shared Bearer headers cannot be mutated between requests."""
+        client = TrestleHttpClient(
+            host="192.168.1.100",
+            port=8080,
+            session=mock_session,
+            secret="stored-secret",
+        )
+        mock_session.get.return_value = create_mock_response(
+            status=200, json_data={"id": "device-123"}
+        )
+
+        await client.fetch_device_id()
+        headers = mock_session.get.call_args.kwargs["headers"]
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer tampered"
+        await client.fetch_device_id()
+
+        assert mock_session.get.call_args.kwargs["headers"] == {
+            "Authorization": "Bearer stored-secret"
+        }
+
     async def test_401_without_secret_no_unpair(self, mock_session: MagicMock) -> None:
         """Test 401 without stored secret does not trigger unpair."""
         client = TrestleHttpClient(
@@ -0,0 +1,226 @@
+"""Test TrestleHttpClient retries of transient request failures."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from trestle_coordinator_core import TrestleHttpClient
+from trestle_coordinator_core.errors import TrestleConnectionError, TrestleTimeout
+
+from .conftest import create_mock_response
+
+
+@pytest.fixture
+def backoff_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace the backoff sleep and jitter so retries run instantly."""
+    sleep = AsyncMock()
+    monkeypatch.setattr("trestle_coordinator_core.transport.http.asyncio.sleep", sleep)
+    monkeypatch.setattr(
+        "trestle_coordinator_core.transport.http.random.uniform",
+        lambda _low, high: high,
+    )
+    return sleep
+
+
+def make_client(session: MagicMock, request_attempts: int) -> TrestleHttpClient:
+    """Create a client with the given attempt budget."""
+    return TrestleHttpClient(
+        host="192.168.1.100",
+        port=8080,
+        session=session,
+        request_attempts=request_attempts,
+        retry_base_delay=0.2,
+        retry_max_delay=0.5,
+    )
+
+
+def connector_error() -> aiohttp.ClientConnectorError:
+    """Create a connection failure (request never reached the device)."""
+    return aiohttp.ClientConnectorError(MagicMock(), OSError("Connection refused"))
+
+
+class TestRetryDefaults:
+    """Test retries are opt-in."""
+
+    async def test_single_attempt_by_default(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test a default client does not retry or sleep."""
+        client = TrestleHttpClient(
+            host="192.168.1.100", port=8080, session=mock_session
+        )
+        mock_session.get.side_effect = connector_error()
+
+        with pytest.raises(TrestleConnectionError):
+            await client.fetch_device_id()
+
+        mock_session.get.assert_called_once()
+        backoff_sleep.assert_not_called()
+
+
+class TestFetchDeviceIdRetries:
+    """Test /api/info retries timeouts and connection failures."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [TimeoutError("Request timed out"), connector_error()],
+        ids=["timeout", "connect"],
+    )
+    async def test_transient_failure_is_retried(
+        self,
+        mock_session: MagicMock,
+        backoff_sleep: AsyncMock,
+        error: Exception,
+    ) -> None:
+        """Test a transient failure is retried until a response arrives."""
+        client = make_client(mock_session, request_attempts=3)
+        mock_session.get.side_effect = [
+            error,
+            create_mock_response(status=200, json_data={"id": "device-123"}),
+        ]
+
+        assert await client.fetch_device_id() == "device-123"
+
+        assert mock_session.get.call_count == 2
+        backoff_sleep.assert_awaited_once_with(0.2)
+
+    async def test_backoff_doubles_up_to_max_delay(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test the backoff cap grows exponentially and is clamped."""
+        client = make_client(mock_session, request_attempts=4)
+        mock_session.get.side_effect = TimeoutError("Request timed out")
+
+        with pytest.raises(TrestleTimeout):
+            await client.fetch_device_id()
+
+        assert [call.args[0] for call in backoff_sleep.await_args_list] == [
+            0.2,
+            0.4,
+            0.5,
+        ]
+
+    async def test_last_timeout_is_raised(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test the attempt budget is honoured and the last error propagates."""
+        client = make_client(mock_session, request_attempts=3)
+        last_error = TimeoutError("third")
+        mock_session.get.side_effect = [
+            TimeoutError("first"),
+            TimeoutError("second"),
+            last_error,
+        ]
+
+        with pytest.raises(TrestleTimeout) as exc_info:
+            await client.fetch_device_id()
+
+        assert exc_info.value.__cause__ is last_error
+        assert mock_session.get.call_count == 3
+
+    async def test_non_transient_error_is_not_retried(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test generic client errors fail on the first attempt."""
+        client = make_client(mock_session, request_attempts=3)
+        mock_session.get.side_effect = aiohttp.ClientPayloadError("bad body")
+
+        with pytest.raises(TrestleConnectionError):
+            await client.fetch_device_id()
+
+        mock_session.get.assert_called_once()
+        backoff_sleep.assert_not_called()
+
+
+class TestSendPairingSecretRetries:
+    """Test /pair only retries failures that never reached the device."""
+
+    async def test_connection_failure_is_retried(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test a connect error is retried."""
+        client = make_client(mock_session, request_attempts=3)
+        mock_session.post.side_effect = [
+            connector_error(),
+            create_mock_response(status=200),
+        ]
+
+        await client.send_pairing_secret("new-secret")
+
+        assert mock_session.post.call_count == 2
+
+    async def test_timeout_is_not_retried(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test a timeout is not retried, since the device may have paired."""
+        client = make_client(mock_session, request_attempts=3)
+        mock_session.post.side_effect = TimeoutError("Request timed out")
+
+        with pytest.raises(TrestleTimeout, match="Pairing request timed out"):
+            await client.send_pairing_secret("new-secret")
+
+        mock_session.post.assert_called_once()
+        backoff_sleep.assert_not_called()
+
+    async def test_last_connection_failure_is_raised(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test every attempt is used before the last error propagates."""
+        client = make_client(mock_session, request_attempts=2)
+        last_error = connector_error()
+        mock_session.post.side_effect = [connector_error(), last_error]
+
+        with pytest.raises(TrestleConnectionError) as exc_info:
+            await client.send_pairing_secret("new-secret")
+
+        assert exc_info.value.__cause__ is last_error
+        assert mock_session.post.call_count == 2
+
+
+class TestFetchScreenshotRetries:
+    """Test /api/screenshot retries timeouts and connection failures."""
+
+    async def test_timeout_is_retried(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test a timeout is retried, since screenshots are read-only."""
+        client = make_client(mock_session, request_attempts=3)
+        response = create_mock_response(status=200, read_data=b"png")
+        response.headers = {"Content-Type": "image/png"}
+        mock_session.get.side_effect = [TimeoutError("Request timed out"), response]
+
+        assert await client.fetch_screenshot(None) == (b"png", "image/png")
+        assert mock_session.get.call_count == 2
+
+    async def test_last_connection_failure_is_raised(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test the attempt budget is honoured and the last error propagates."""
+        client = make_client(mock_session, request_attempts=3)
+        last_error = connector_error()
+        mock_session.get.side_effect = [
+            connector_error(),
+            TimeoutError("Request timed out"),
+            last_error,
+        ]
+
+        with pytest.raises(TrestleConnectionError) as exc_info:
+            await client.fetch_screenshot(None)
+
+        assert exc_info.value.__cause__ is last_error
+        assert mock_session.get.call_count == 3
+        assert backoff_sleep.await_count == 2
+
+    async def test_error_status_is_not_retried(
+        self, mock_session: MagicMock, backoff_sleep: AsyncMock
+    ) -> None:
+        """Test a non-200 response returns None without retrying."""
+        client = make_client(mock_session, request_attempts=3)
+        mock_session.get.return_value = create_mock_response(status=503)
+
+        assert await client.fetch_screenshot(None) is None
+
+        mock_session.get.assert_called_once()
@@ -0,0 +1,27 @@
+"""Test TrestleHttpClient.build_shared_session()."""
+
+from __future__ import annotations
+
+import warnings
+
+from trestle_coordinator_core import TrestleHttpClient
+
+
+class TestBuildSharedSession:
+    """Test the pooled keep-alive session helper."""
+
+    async def test_connector_is_pooled(self) -> None:
+        """Test the session keeps idle connections alive and caps per host."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            session = TrestleHttpClient.build_shared_session()
+        try:
+            connector = session.connector
+            assert connector is not None
+            assert connector.limit == 100
+            assert connector.limit_per_host == 4
+            assert connector._keepalive_timeout == 60
+        finally:
+            await session.close()
+
+        assert session.closed
@@ -151,3 +151,43 @@ class TestUnpairDevice:
         timeout = call_kwargs.get("timeout")
         assert timeout is not None
         assert timeout.total == 10
+
+    async def test_unpair_retries_transient_timeout(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test a timeout is retried, since unpair is idempotent."""
+        client = TrestleHttpClient(
+            host="192.168.1.100",
+            port=8080,
+            session=mock_session,
+            request_attempts=3,
+            retry_base_delay=0,
+        )
+
+        mock_session.post.side_effect = [
+            TimeoutError("Request timed out"),
+            create_mock_response(status=200),
+        ]
+
+        await client.unpair_device()
+
+        assert mock_session.post.call_count == 2
+
+    async def test_unpair_does_not_retry_error_status(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test non-200 responses are not retried."""
+        client = TrestleHttpClient(
+            host="192.168.1.100",
+            port=8080,
+            session=mock_session,
+            request_attempts=3,
+            retry_base_delay=0,
+        )
+
+        mock_session.post.return_value = create_mock_response(status=500)
+
+        with pytest.raises(TrestleResponseError):
+            await client.unpair_device()
+
+        mock_session.post.assert_called_once()
@@ -20,7 +20,10 @@ from trestle_coordinator_core.policy_engine import (
 from trestle_coordinator_core.profile import (
     DomainNotFoundError,
     DomainScope,
+    LoadedPolicy,
     LoadedProfile,
+    PolicyCondition,
+    PolicyRule,
     QuietHours,
     load_domain,
     load_profile,
@@ -133,6 +136,20 @@ class TestProfileLoading:
         assert "doorbell" in rule_ids
         assert "motion_info" in rule_ids
 
+    def test_rules_indexed_by_domain(self) -> None:
+        """Each domain's rules are indexed in evaluation order."""
+        rules = [
+            PolicyRule(rule_id="a", when=PolicyCondition(domain="security")),
+            PolicyRule(rule_id="b", when=PolicyCondition(domain="doorbell")),
+            PolicyRule(rule_id="c", when=PolicyCondition(domain="security")),
+        ]
+        policy = LoadedPolicy(quiet_hours=None, rules=rules)
+
+        assert policy.rules_by_domain == {
+            "security": (rules[0], rules[2]),
+            "doorbell": (rules[1],),
+        }
+
     def test_missing_domain_raises_error(self, home_runtime_dir: Path) -> None:
         """Missing domain file raises DomainNotFoundError."""
         domains_dir = home_runtime_dir / "domains"
@@ -167,6 +184,29 @@ class TestQuietHours:
         assert qh.is_active(time(16, 1)) is False
 
 
+class TestPolicyConditionMatching:
+    """Tests for 'when' clause matching."""
+
+    def test_state_match(self) -> None:
+        """State clause matches only the same domain and state."""
+        when = PolicyCondition(domain="security", state="door_open")
+        assert when.matches("security", "door_open", None) is True
+        assert when.matches("security", "idle", None) is False
+        assert when.matches("occupancy", "door_open", None) is False
+
+    def test_event_match(self) -> None:
+        """Event clause ignores state and requires the event."""
+        when = PolicyCondition(domain="doorbell", event="pressed")
+        assert when.matches("doorbell", "idle", "pressed") is True
+        assert when.matches("doorbell", "idle", None) is False
+
+    def test_domain_only_match(self) -> None:
+        """Domain-only clause matches any state of that domain."""
+        when = PolicyCondition(domain="timer")
+        assert when.matches("timer", "done", None) is True
+        assert when.matches("timer", None, None) is True
+
+
 # =============================================================================
 # Policy Evaluation Tests (Step 4)
 # =============================================================================
@@ -458,6 +498,13 @@ class TestImportanceOrdering:
         assert Importance.from_string("critical") == Importance.CRITICAL
         assert Importance.from_string("HIGH") == Importance.HIGH
 
+    def test_importance_label(self) -> None:
+        """Importance exposes its policy-file spelling."""
+        assert Importance.CRITICAL.label == "critical"
+        assert max(Importance.LOW, Importance.HIGH) is Importance.HIGH
+        with pytest.raises(ValueError, match="not a valid Importance"):
+            Importance.from_string("urgent")
+
 
 # =============================================================================
 # Integration Tests
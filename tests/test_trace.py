@@ -4,7 +4,11 @@ Slice: 8i - Decision Tracing & Explainability
 """
 
 import json
+import os
 from datetime import datetime
+from time import time_ns
+
+import pytest
 
 from trestle_coordinator_core.trace import (
     ArbitrationTrace,
@@ -14,6 +18,7 @@ from trestle_coordinator_core.trace import (
     DecisionTrace,
     DomainSnapshot,
     DomainStateEntry,
+    FailedConditions,
     FusionContribution,
     IntentClassification,
     OutcomeType,
@@ -27,9 +32,15 @@ from trestle_coordinator_core.trace import (
     Trigger,
     TriggerType,
     WinningIntent,
+    new_trace_id,
 )
 
 
+def epoch_ns(when: datetime) -> int:
+    """Convert a whole-second naive datetime to epoch nanoseconds."""
+    return int(when.timestamp()) * 1_000_000_000
+
+
 class TestTrigger:
     """Tests for Trigger dataclass."""
 
@@ -67,10 +78,7 @@ class TestDomainSnapshot:
 
     def test_empty_snapshot(self) -> None:
         """Test snapshot with no domains."""
-        snapshot = DomainSnapshot(
-            domains=[],
-            snapshot_time=datetime.now(),
-        )
+        snapshot = DomainSnapshot(domains=())
 
         assert len(snapshot.domains) == 0
         assert len(snapshot.active_effects) == 0
@@ -97,8 +105,7 @@ class TestDomainSnapshot:
         )
 
         snapshot = DomainSnapshot(
-            domains=[domain],
-            snapshot_time=datetime.now(),
+            domains=(domain,),
             time_of_day="14:30",
         )
 
@@ -106,6 +113,20 @@ class TestDomainSnapshot:
         assert snapshot.domains[0].fusion is not None
         assert snapshot.domains[0].fusion.confidence == 0.92
 
+    def test_snapshot_time_defaults_to_now(self) -> None:
+        """Test the snapshot is stamped with the construction time."""
+        before = time_ns()
+        snapshot = DomainSnapshot(domains=())
+
+        assert before <= snapshot.snapshot_time_ns <= time_ns()
+
+    def test_snapshot_time_converts_ns(self) -> None:
+        """Test snapshot_time is the datetime form of snapshot_time_ns."""
+        when = datetime(2025, 1, 15, 22, 35, 42)
+        snapshot = DomainSnapshot(domains=(), snapshot_time_ns=epoch_ns(when))
+
+        assert snapshot.snapshot_time == when
+
 
 class TestRuleEvaluation:
     """Tests for rule evaluation trace."""
@@ -189,10 +210,7 @@ class TestDecisionTrace:
             type=TriggerType.STATE_CHANGE,
             domain="security",
         )
-        snapshot = DomainSnapshot(
-            domains=[],
-            snapshot_time=datetime.now(),
-        )
+        snapshot = DomainSnapshot(domains=())
 
         trace = DecisionTrace.create(
             profile_id="test-profile",
@@ -205,11 +223,62 @@ class TestDecisionTrace:
         assert trace.profile_id == "test-profile"
         assert trace.outcome.type == OutcomeType.NO_ACTION
 
+    def test_create_uses_injected_clock(self) -> None:
+        """Test the trace timestamp comes from the injected clock."""
+        fixed = datetime(2025, 1, 15, 22, 30)
+
+        trace = DecisionTrace.create(
+            profile_id="test-profile",
+            trigger=Trigger(type=TriggerType.STATE_CHANGE, domain="security"),
+            domain_snapshot=DomainSnapshot(domains=()),
+            clock=lambda: epoch_ns(fixed),
+        )
+
+        assert trace.timestamp_ns == epoch_ns(fixed)
+        assert trace.timestamp == fixed
+
+    def test_create_trace_ids_unique(self) -> None:
+        """Test generated trace IDs are unique within the process."""
+        trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
+        snapshot = DomainSnapshot(domains=())
+
+        ids = {
+            DecisionTrace.create(
+                profile_id="test-profile",
+                trigger=trigger,
+                domain_snapshot=snapshot,
+            ).trace_id
+            for _ in range(100)
+        }
+
+        assert len(ids) == 100
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_gets_fresh_trace_id_prefix(self) -> None:
+        """Test a forked child re-seeds the prefix and restarts the counter."""
+        parent_id = new_trace_id()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, new_trace_id().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        child_id = os.read(read_fd, 256).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        child_prefix, child_counter = child_id.rsplit("-", 1)
+        assert child_prefix != parent_id.rsplit("-", 1)[0]
+        assert child_prefix.startswith(f"{pid:x}-")
+        assert child_counter == "0"
+
     def test_complete_trace(self) -> None:
         """Test a complete decision trace."""
         trace = DecisionTrace(
             trace_id="test-trace-id",
-            timestamp=datetime(2025, 1, 15, 22, 35, 42),
+            timestamp_ns=epoch_ns(datetime(2025, 1, 15, 22, 35, 42)),
             profile_id="home-family",
             profile_version="1.0.0",
             home_id="home-123",
@@ -221,7 +290,7 @@ class TestDecisionTrace:
                 new_state="door_open",
             ),
             domain_snapshot=DomainSnapshot(
-                domains=[
+                domains=(
                     DomainStateEntry(
                         domain="security",
                         state="door_open",
@@ -232,8 +301,8 @@ class TestDecisionTrace:
                         state="away",
                         scope_id="house",
                     ),
-                ],
-                snapshot_time=datetime(2025, 1, 15, 22, 35, 42),
+                ),
+                snapshot_time_ns=epoch_ns(datetime(2025, 1, 15, 22, 35, 42)),
                 time_of_day="22:35",
             ),
             policy_trace=PolicyEvaluationTrace(
@@ -306,8 +375,8 @@ class TestDecisionTrace:
                 domain="security",
             ),
             domain_snapshot=DomainSnapshot(
-                domains=[],
-                snapshot_time=datetime(2025, 1, 15, 12, 0, 0),
+                domains=(),
+                snapshot_time_ns=epoch_ns(datetime(2025, 1, 15, 12, 0, 0)),
             ),
         )
 
@@ -317,6 +386,9 @@ class TestDecisionTrace:
         assert data["trigger"]["type"] == "state_change"
         assert data["trigger"]["domain"] == "security"
         assert data["outcome"]["type"] == "no_action"
+        assert data["domain_snapshot"]["snapshot_time"] == "2025-01-15T12:00:00"
+        assert "snapshot_time_ns" not in data["domain_snapshot"]
+        assert data["timestamp"] == trace.timestamp.isoformat()
 
         # Should be JSON serializable
         json_str = json.dumps(data)
@@ -369,11 +441,11 @@ class TestDecisionLineage:
     def test_decision_id(self) -> None:
         """Test decision_id for stable referencing."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
-        snapshot = DomainSnapshot(domains=[], snapshot_time=datetime.now())
+        snapshot = DomainSnapshot(domains=())
 
         trace = DecisionTrace(
             trace_id="unique-trace-id",
-            timestamp=datetime.now(),
+            timestamp_ns=time_ns(),
             profile_id="test-profile",
             trigger=trigger,
             domain_snapshot=snapshot,
@@ -388,12 +460,12 @@ class TestDecisionLineage:
     def test_decision_lineage(self) -> None:
         """Test parent_decision_id for escalation/retry chaining."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
-        snapshot = DomainSnapshot(domains=[], snapshot_time=datetime.now())
+        snapshot = DomainSnapshot(domains=())
 
         # Original decision
         original = DecisionTrace(
             trace_id="trace-1",
-            timestamp=datetime.now(),
+            timestamp_ns=time_ns(),
             profile_id="test-profile",
             trigger=trigger,
             domain_snapshot=snapshot,
@@ -405,7 +477,7 @@ class TestDecisionLineage:
         # Escalated decision referencing parent
         escalated = DecisionTrace(
             trace_id="trace-2",
-            timestamp=datetime.now(),
+            timestamp_ns=time_ns(),
             profile_id="test-profile",
             trigger=trigger,
             domain_snapshot=snapshot,
@@ -477,3 +549,13 @@ class TestFailedConditions:
 
         assert len(rule.failed_conditions) == 3
         assert "media_activity == playing" in rule.failed_conditions
+
+    def test_lazy_failed_conditions_behave_like_a_list(self) -> None:
+        """Test lazily formatted reasons equal the list form and are unhashable."""
+        failed = FailedConditions([("occupancy", "home"), ("sleep", "awake")])
+
+        assert failed == ["occupancy == home", "sleep == awake"]
+        assert failed == FailedConditions([("occupancy", "home"), ("sleep", "awake")])
+        assert failed[1:] == ["sleep == awake"]
+        with pytest.raises(TypeError):
+            hash(failed)
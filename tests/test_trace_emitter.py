@@ -1,6 +1,7 @@
 """Tests for trace emission (Slice 8i-2)."""
 
 from datetime import datetime, time
+from time import time_ns
 
 from trestle_coordinator_core.policy_engine import (
     DomainState,
@@ -113,6 +114,22 @@ class TestEmitters:
         assert last_two[0].profile_id == "profile-3"
         assert last_two[1].profile_id == "profile-4"
 
+    def test_buffer_emitter_last_bounds(self) -> None:
+        """BufferEmitter.last() should clamp to the buffered traces."""
+        emitter = BufferEmitter(max_size=3)
+
+        for i in range(5):
+            trace = _create_minimal_trace()
+            trace.profile_id = f"profile-{i}"
+            emitter.emit(trace)
+
+        assert [t.profile_id for t in emitter.last(10)] == [
+            "profile-2",
+            "profile-3",
+            "profile-4",
+        ]
+        assert emitter.last(0) == []
+
     def test_callback_emitter(self) -> None:
         """CallbackEmitter should call the callback."""
         received: list = []
@@ -131,7 +148,7 @@ class TestTraceBuilder:
     def test_minimal_trace(self) -> None:
         """Build a minimal trace."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
-        snapshot = DomainSnapshot(domains=[], snapshot_time=datetime.now())
+        snapshot = DomainSnapshot(domains=())
 
         builder = TraceBuilder(
             profile_id="test-profile",
@@ -151,7 +168,7 @@ class TestTraceBuilder:
     def test_trace_with_decision_id(self) -> None:
         """Trace should include decision ID for lineage."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
-        snapshot = DomainSnapshot(domains=[], snapshot_time=datetime.now())
+        snapshot = DomainSnapshot(domains=())
 
         builder = TraceBuilder(
             profile_id="test-profile",
@@ -170,7 +187,7 @@ class TestTraceBuilder:
     def test_trace_with_rule_evaluations(self) -> None:
         """Trace should accumulate rule evaluations."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
-        snapshot = DomainSnapshot(domains=[], snapshot_time=datetime.now())
+        snapshot = DomainSnapshot(domains=())
 
         builder = TraceBuilder(
             profile_id="test-profile",
@@ -201,11 +218,10 @@ class TestTraceBuilder:
         """Trace should include timing metrics when enabled."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
         snapshot = DomainSnapshot(
-            domains=[
+            domains=(
                 DomainStateEntry(domain="security", state="alert"),
                 DomainStateEntry(domain="occupancy", state="away"),
-            ],
-            snapshot_time=datetime.now(),
+            ),
         )
 
         builder = TraceBuilder(
@@ -228,10 +244,29 @@ class TestTraceBuilder:
         assert trace.metrics.rules_evaluated == 1
         assert trace.metrics.total_duration_us >= 0
 
+    def test_trace_uses_injected_clock(self) -> None:
+        """Trace timestamp should come from the injected clock."""
+        trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
+        snapshot = DomainSnapshot(domains=())
+        fixed = datetime(2025, 1, 15, 22, 30)
+
+        builder = TraceBuilder(
+            profile_id="test-profile",
+            profile_version=None,
+            home_id=None,
+            trigger=trigger,
+            domain_snapshot=snapshot,
+            clock=lambda: int(fixed.timestamp()) * 1_000_000_000,
+        )
+
+        trace = builder.build()
+
+        assert trace.timestamp == fixed
+
     def test_trace_without_metrics(self) -> None:
         """Trace should omit metrics when disabled."""
         trigger = Trigger(type=TriggerType.STATE_CHANGE, domain="security")
-        snapshot = DomainSnapshot(domains=[], snapshot_time=datetime.now())
+        snapshot = DomainSnapshot(domains=())
 
         builder = TraceBuilder(
             profile_id="test-profile",
@@ -284,6 +319,23 @@ class TestHelperFunctions:
         assert len(snapshot.domains) == 2
         assert snapshot.time_of_day == "22:30"
 
+    def test_build_domain_snapshot_time_of_day(self) -> None:
+        """A datetime.time is recorded as HH:MM and domains are a tuple."""
+        snapshot = build_domain_snapshot({}, current_time=time(7, 5, 30))
+
+        assert snapshot.time_of_day == "07:05"
+        assert snapshot.domains == ()
+
+    def test_build_domain_snapshot_clock(self) -> None:
+        """Snapshot time is stored as nanoseconds from the clock."""
+        fixed = datetime(2025, 1, 15, 22, 30)
+        ns = int(fixed.timestamp()) * 1_000_000_000
+
+        snapshot = build_domain_snapshot({}, current_time="22:30", clock=lambda: ns)
+
+        assert snapshot.snapshot_time_ns == ns
+        assert snapshot.snapshot_time == fixed
+
     def test_determine_outcome_no_intents(self) -> None:
         """No intents means no action."""
         outcome_type, winner = determine_outcome([])
@@ -408,6 +460,35 @@ class TestRuleEvaluationTracing:
         assert evaluation.when_clause.satisfied
         assert "occupancy == away" in evaluation.failed_conditions
 
+    def test_failed_conditions_serialize_as_strings(self) -> None:
+        """Deferred failed conditions render as strings in to_dict()."""
+        rule = PolicyRule(
+            rule_id="door-alert-away",
+            when=PolicyCondition(domain="security", state="door_open"),
+            conditions={"occupancy": "away"},
+            classify=PolicyClassification(importance="critical"),
+        )
+        state = DomainState(domain="security", state="idle")
+        context = EvaluationContext(
+            domain_states={"security": state},
+            current_time=time(22, 30),
+        )
+
+        evaluation = trace_rule_evaluation(rule, state, context, None)
+
+        assert len(evaluation.failed_conditions) == 2
+        assert list(evaluation.failed_conditions) == [
+            "security == door_open",
+            "occupancy == away",
+        ]
+        trace = _create_minimal_trace()
+        trace.policy_trace.rules.append(evaluation)
+        rules = trace.to_dict()["policy_trace"]["rules"]
+        assert rules[0]["failed_conditions"] == [
+            "security == door_open",
+            "occupancy == away",
+        ]
+
     def test_trace_suppressed_rule(self) -> None:
         """Trace a rule that matched but was suppressed."""
         rule = PolicyRule(
@@ -450,10 +531,10 @@ def _create_minimal_trace():
 
     return DecisionTrace(
         trace_id="test-trace",
-        timestamp=datetime.now(),
+        timestamp_ns=time_ns(),
         profile_id="test-profile",
         trigger=Trigger(type=TriggerType.STATE_CHANGE, domain="test"),
-        domain_snapshot=DomainSnapshot(domains=[], snapshot_time=datetime.now()),
+        domain_snapshot=DomainSnapshot(domains=()),
         policy_trace=PolicyEvaluationTrace(rules=[]),
         outcome=DecisionOutcome(type=OutcomeType.NO_ACTION),
     )
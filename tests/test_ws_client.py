@@ -58,81 +58,70 @@ class TestTrestleWsClientConnect:
     """Tests for TrestleWsClient.connect()."""
 
     @pytest.mark.asyncio
-    async def test_connect_success(self):
+    async def test_connect_success(self, mock_connect):
         """Test successful WebSocket connection."""
         mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ) as mock_connect:
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
-
-            mock_connect.assert_called_once_with(
-                "192.168.1.100",
-                80,
-                path="/ws",
-                ping_interval=20,
-                timeout=15.0,
-            )
-            assert client._ws is mock_ws
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+
+        mock_connect.assert_called_once_with(
+            "192.168.1.100",
+            80,
+            path="/ws",
+            ping_interval=20,
+            timeout=15.0,
+        )
+        assert client._ws is mock_ws
 
     @pytest.mark.asyncio
-    async def test_connect_custom_params(self):
+    async def test_connect_custom_params(self, mock_connect):
         """Test connection with custom parameters."""
         mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ) as mock_connect:
-            client = TrestleWsClient()
-            await client.connect(
-                "10.0.0.1",
-                8080,
-                path="/api/trestle_ha/tool/ws",
-                ping_interval=30,
-                timeout=5.0,
-            )
-
-            mock_connect.assert_called_once_with(
-                "10.0.0.1",
-                8080,
-                path="/api/trestle_ha/tool/ws",
-                ping_interval=30,
-                timeout=5.0,
-            )
+        client = TrestleWsClient()
+        await client.connect(
+            "10.0.0.1",
+            8080,
+            path="/api/trestle_ha/tool/ws",
+            ping_interval=30,
+            timeout=5.0,
+        )
+
+        mock_connect.assert_called_once_with(
+            "10.0.0.1",
+            8080,
+            path="/api/trestle_ha/tool/ws",
+            ping_interval=30,
+            timeout=5.0,
+        )
 
     @pytest.mark.asyncio
-    async def test_connect_propagates_errors(self):
+    async def test_connect_propagates_errors(self, mock_connect):
         """Test that connection errors are propagated."""
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            side_effect=TrestleConnectionError("Connection failed"),
-        ):
-            client = TrestleWsClient()
-            with pytest.raises(TrestleConnectionError, match="Connection failed"):
-                await client.connect("192.168.1.100", 80)
+        mock_connect.side_effect = TrestleConnectionError("Connection failed")
+
+        client = TrestleWsClient()
+        with pytest.raises(TrestleConnectionError, match="Connection failed"):
+            await client.connect("192.168.1.100", 80)
 
 
 class TestTrestleWsClientClose:
     """Tests for TrestleWsClient.close()."""
 
     @pytest.mark.asyncio
-    async def test_close_connected(self):
+    async def test_close_connected(self, mock_connect):
         """Test closing a connected client."""
         mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
-            await client.close()
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+        await client.close()
 
-            mock_ws.close.assert_called_once()
+        mock_ws.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_close_not_connected(self):
@@ -146,19 +135,33 @@ class TestTrestleWsClientSendJson:
     """Tests for TrestleWsClient.send_json()."""
 
     @pytest.mark.asyncio
-    async def test_send_json_success(self):
+    async def test_send_json_success(self, mock_connect):
         """Test sending JSON payload."""
         mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
-            await client.send_json({"type": "auth", "token": "secret"})
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+        await client.send_json({"type": "auth", "token": "secret"})
+
+        mock_ws.send.assert_called_once()
+        sent = mock_ws.send.call_args.args[0]
+        assert isinstance(sent, bytes)
+        assert json.loads(sent) == {"type": "auth", "token": "secret"}
+        assert mock_ws.send.call_args.kwargs == {"text": True}
+
+    @pytest.mark.asyncio
+    async def test_send_json_non_str_keys(self, mock_connect):
+        """Test nested non-str keys are stringified, as stdlib json does."""
+        mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
+
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+        await client.send_json({"type": "state", "values": {1: "a"}})
 
-            mock_ws.send.assert_called_once_with('{"type": "auth", "token": "secret"}')
+        sent = mock_ws.send.call_args.args[0]
+        assert json.loads(sent) == {"type": "state", "values": {"1": "a"}}
 
     @pytest.mark.asyncio
     async def test_send_json_not_connected(self):
@@ -168,23 +171,64 @@ class TestTrestleWsClientSendJson:
             await client.send_json({"type": "test"})
 
 
+class TestTrestleWsClientSendBatch:
+    """Tests for TrestleWsClient.send_batch()."""
+
+    @pytest.mark.asyncio
+    async def test_send_batch_in_order(self, mock_connect):
+        """Test batch frames are sent in order as TEXT frames."""
+        mock_ws = AsyncMock()
+        mock_ws.transport = MagicMock()
+        mock_ws.transport.get_extra_info.return_value = None
+        mock_connect.return_value = mock_ws
+
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+        await client.send_batch([{"seq": 1}, {"seq": 2}])
+
+        assert [json.loads(c.args[0]) for c in mock_ws.send.call_args_list] == [
+            {"seq": 1},
+            {"seq": 2},
+        ]
+        assert all(c.kwargs == {"text": True} for c in mock_ws.send.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_send_batch_uncorks_socket(self, mock_connect):
+        """Test the socket is uncorked after the batch when TCP_CORK exists."""
+        mock_ws = AsyncMock()
+        mock_ws.transport = MagicMock()
+        sock = mock_ws.transport.get_extra_info.return_value
+        mock_connect.return_value = mock_ws
+
+        with patch("trestle_coordinator_core.transport.ws_client._TCP_CORK", 3):
+            client = TrestleWsClient()
+            await client.connect("192.168.1.100", 80)
+            await client.send_batch([{"seq": 1}])
+
+        assert [c.args[2] for c in sock.setsockopt.call_args_list] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_send_batch_not_connected(self):
+        """Test send_batch raises when not connected."""
+        client = TrestleWsClient()
+        with pytest.raises(TrestleConnectionError, match="not connected"):
+            await client.send_batch([{"type": "test"}])
+
+
 class TestTrestleWsClientSendBytes:
     """Tests for TrestleWsClient.send_bytes()."""
 
     @pytest.mark.asyncio
-    async def test_send_bytes_success(self):
+    async def test_send_bytes_success(self, mock_connect):
         """Test sending binary data."""
         mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
-            await client.send_bytes(b"\x00\x01\x02\x03")
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+        await client.send_bytes(b"\x00\x01\x02\x03")
 
-            mock_ws.send.assert_called_once_with(b"\x00\x01\x02\x03")
+        mock_ws.send.assert_called_once_with(b"\x00\x01\x02\x03")
 
     @pytest.mark.asyncio
     async def test_send_bytes_not_connected(self):
@@ -227,18 +271,15 @@ class TestTrestleWsClientIteration:
             await client.__anext__()
 
     @pytest.mark.asyncio
-    async def test_iter_text_messages(self):
+    async def test_iter_text_messages(self, mock_connect):
         """Test iterating over text messages."""
         mock_ws = AsyncIteratorMock(["message1", "message2"])
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
 
-            messages = [msg async for msg in client]
+        messages = [msg async for msg in client]
 
         # Should have 2 text messages + closed at end
         text_messages = [m for m in messages if m.type == TrestleWsMessageType.TEXT]
@@ -247,52 +288,60 @@ class TestTrestleWsClientIteration:
         assert text_messages[1].data == "message2"
 
     @pytest.mark.asyncio
-    async def test_iter_connection_closed(self):
+    async def test_anext_steps_through_messages(self, mock_connect):
+        """Test __anext__ yields messages, then CLOSED, then stops."""
+        mock_ws = AsyncIteratorMock(["message1"])
+        mock_connect.return_value = mock_ws
+
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
+
+        first = await client.__anext__()
+        closed = await client.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await client.__anext__()
+
+        assert first.data == "message1"
+        assert closed.type == TrestleWsMessageType.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_iter_connection_closed(self, mock_connect):
         """Test iteration handles ConnectionClosed."""
         mock_ws = AsyncIteratorMock([], raise_on_iter=ConnectionClosed(None, None))
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
 
-            messages = [msg async for msg in client]
+        messages = [msg async for msg in client]
 
         assert len(messages) == 1
         assert messages[0].type == TrestleWsMessageType.CLOSED
 
     @pytest.mark.asyncio
-    async def test_iter_unexpected_error(self):
+    async def test_iter_unexpected_error(self, mock_connect):
         """Test iteration handles unexpected errors."""
         mock_ws = AsyncIteratorMock([], raise_on_iter=RuntimeError("Unexpected"))
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
 
-            messages = [msg async for msg in client]
+        messages = [msg async for msg in client]
 
         assert len(messages) == 1
         assert messages[0].type == TrestleWsMessageType.ERROR
 
     @pytest.mark.asyncio
-    async def test_iter_graceful_close(self):
+    async def test_iter_graceful_close(self, mock_connect):
         """Test iteration emits CLOSED on graceful completion."""
         mock_ws = AsyncIteratorMock(["hello"])
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
 
-            messages = [msg async for msg in client]
+        messages = [msg async for msg in client]
 
         # Should have text message + closed message
         assert len(messages) == 2
@@ -301,18 +350,15 @@ class TestTrestleWsClientIteration:
         assert messages[1].type == TrestleWsMessageType.CLOSED
 
     @pytest.mark.asyncio
-    async def test_iter_skips_binary_messages(self):
+    async def test_iter_skips_binary_messages(self, mock_connect):
         """Test iteration skips binary messages."""
         mock_ws = AsyncIteratorMock(["text1", b"\x00\x01\x02", "text2"])
+        mock_connect.return_value = mock_ws
 
-        with patch(
-            "trestle_coordinator_core.transport.ws_client.connect_websocket",
-            return_value=mock_ws,
-        ):
-            client = TrestleWsClient()
-            await client.connect("192.168.1.100", 80)
+        client = TrestleWsClient()
+        await client.connect("192.168.1.100", 80)
 
-            messages = [msg async for msg in client]
+        messages = [msg async for msg in client]
 
         # Should have 2 text messages + closed (binary skipped)
         text_messages = [m for m in messages if m.type == TrestleWsMessageType.TEXT]
@@ -336,6 +382,11 @@ class TestTrestleWsClientNormalization:
         result = TrestleWsClient._normalize_message(b"\x00\x01\x02")
         assert result is None
 
+    def test_normalize_bytearray_returns_none(self):
+        """Test normalizing a bytearray frame returns None (skipped)."""
+        result = TrestleWsClient._normalize_message(bytearray(b"\x00"))
+        assert result is None
+
     def test_normalize_unknown_object(self):
         """Test normalizing unknown object uses string repr."""
         obj = object()
@@ -348,46 +399,32 @@ class TestTrestleWsClientNormalization:
 class TestTrestleWsClientAiohttpNormalization:
     """Tests for aiohttp WSMsgType normalization."""
 
-    def test_map_text_type(self):
-        """Test mapping aiohttp TEXT type."""
+    @pytest.mark.parametrize(
+        ("type_name", "expected"),
+        [
+            ("TEXT", TrestleWsMessageType.TEXT),
+            ("BINARY", None),
+            ("CLOSE", TrestleWsMessageType.CLOSED),
+            ("CLOSING", TrestleWsMessageType.CLOSED),
+            ("CLOSED", TrestleWsMessageType.CLOSED),
+            ("ERROR", TrestleWsMessageType.ERROR),
+        ],
+    )
+    def test_normalize_aiohttp_types(self, type_name, expected):
+        """Test each aiohttp WSMsgType maps to the internal message type."""
         try:
             from aiohttp import WSMsgType
-
-            result = TrestleWsClient._map_aiohttp_type(WSMsgType.TEXT)
-            assert result == TrestleWsMessageType.TEXT
         except ImportError:
             pytest.skip("aiohttp not installed")
 
-    def test_map_binary_type(self):
-        """Test mapping aiohttp BINARY type returns None."""
-        try:
-            from aiohttp import WSMsgType
+        msg = MagicMock(type=WSMsgType[type_name], data="{}")
 
-            result = TrestleWsClient._map_aiohttp_type(WSMsgType.BINARY)
+        result = TrestleWsClient._normalize_message(msg)
+        if expected is None:
             assert result is None
-        except ImportError:
-            pytest.skip("aiohttp not installed")
-
-    def test_map_close_types(self):
-        """Test mapping aiohttp close-related types."""
-        try:
-            from aiohttp import WSMsgType
-
-            for close_type in [WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED]:
-                result = TrestleWsClient._map_aiohttp_type(close_type)
-                assert result == TrestleWsMessageType.CLOSED
-        except ImportError:
-            pytest.skip("aiohttp not installed")
-
-    def test_map_error_type(self):
-        """Test mapping aiohttp ERROR type."""
-        try:
-            from aiohttp import WSMsgType
-
-            result = TrestleWsClient._map_aiohttp_type(WSMsgType.ERROR)
-            assert result == TrestleWsMessageType.ERROR
-        except ImportError:
-            pytest.skip("aiohttp not installed")
+        else:
+            assert result is not None
+            assert result.type == expected
 
     def test_normalize_aiohttp_message(self):
         """Test normalizing a mock aiohttp message."""
@@ -405,6 +442,21 @@ class TestTrestleWsClientAiohttpNormalization:
         except ImportError:
             pytest.skip("aiohttp not installed")
 
+    def test_normalize_aiohttp_close_and_binary(self):
+        """Test aiohttp CLOSE maps to CLOSED and BINARY is skipped."""
+        try:
+            from aiohttp import WSMsgType
+        except ImportError:
+            pytest.skip("aiohttp not installed")
+
+        close_msg = MagicMock(type=WSMsgType.CLOSE, data=1000)
+        binary_msg = MagicMock(type=WSMsgType.BINARY, data=b"\x00")
+
+        closed = TrestleWsClient._normalize_message(close_msg)
+        assert closed is not None
+        assert closed.type == TrestleWsMessageType.CLOSED
+        assert TrestleWsClient._normalize_message(binary_msg) is None
+
 
 class TestTrestleWsClientDecodeJson:
     """Tests for TrestleWsClient.decode_json()."""
@@ -427,6 +479,15 @@ class TestTrestleWsClientDecodeJson:
         result = TrestleWsClient.decode_json(msg)
         assert result["body"]["nested"]["value"] == 42
 
+    def test_decode_bytes_json(self):
+        """Test decoding raw UTF-8 bytes from a TEXT message."""
+        msg = TrestleWsMessage(
+            type=TrestleWsMessageType.TEXT,
+            data=b'{"type": "pong", "seq": 3}',
+        )
+        result = TrestleWsClient.decode_json(msg)
+        assert result == {"type": "pong", "seq": 3}
+
     def test_decode_non_text_raises(self):
         """Test decoding non-TEXT message raises error."""
         msg = TrestleWsMessage(type=TrestleWsMessageType.CLOSED)
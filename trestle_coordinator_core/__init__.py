@@ -12,6 +12,8 @@ Subpackages:
 
 __version__ = "0.1.0"
 
+from typing import TYPE_CHECKING, Any
+
 from .adapter import (
     FACT_SCHEMAS,
     INTENT_SCHEMAS,
@@ -26,6 +28,9 @@ from .adapter import (
     FactSink,
     FactType,
     IntentType,
+    encode_intent,
+    validate_fact,
+    validate_intent,
 )
 from .decision import (
     INTERRUPT_THRESHOLD,
@@ -56,9 +61,11 @@ from .decision import (
     compute_attention_level_from_device,
     produce_alert_frame,
     produce_realization_frame,
+    produce_realization_frame_bytes,
     realize_alert,
     realize_attention,
     select_device,
+    select_devices_batch,
     trace_decision,
 )
 from .errors import (
@@ -92,21 +99,57 @@ from .profile import (
     load_policy,
     load_profile,
 )
-from .transport import (
-    TrestleHttpClient,
-    TrestleSession,
-    TrestleWsClient,
-    TrestleWsMessage,
-    TrestleWsMessageType,
-    build_auth_confirmed,
-    build_auth_invalid,
-    build_auth_ok,
-    build_envelope,
-    build_time_body,
-    connect_websocket,
-    parse_auth_ok,
+
+if TYPE_CHECKING:
+    from .transport import (
+        TrestleHttpClient,
+        TrestleSession,
+        TrestleWsClient,
+        TrestleWsMessage,
+        TrestleWsMessageType,
+        build_auth_confirmed,
+        build_auth_invalid,
+        build_auth_ok,
+        build_envelope,
+        build_time_body,
+        connect_websocket,
+        parse_auth_ok,
+    )
+
+# Transport names are loaded lazily (PEP 562): the pure decision/policy API
+# should not pay for aiohttp and websockets at import time.
+_TRANSPORT_EXPORTS = frozenset(
+    {
+        "TrestleHttpClient",
+        "TrestleSession",
+        "TrestleWsClient",
+        "TrestleWsMessage",
+        "TrestleWsMessageType",
+        "build_auth_confirmed",
+        "build_auth_invalid",
+        "build_auth_ok",
+        "build_envelope",
+        "build_time_body",
+        "connect_websocket",
+        "parse_auth_ok",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    if name not in _TRANSPORT_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import transport
+
+    value = getattr(transport, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_TRANSPORT_EXPORTS})
+
+
 SUPPORTED_PROTOCOL_VERSIONS: tuple[int, ...] = (1,)
 
 __all__ = [
@@ -184,6 +227,7 @@ __all__ = [
     "compute_attention_level",
     "compute_attention_level_from_device",
     "connect_websocket",
+    "encode_intent",
     "evaluate_all_states",
     "evaluate_domain_update",
     "load_domain",
@@ -192,8 +236,12 @@ __all__ = [
     "parse_auth_ok",
     "produce_alert_frame",
     "produce_realization_frame",
+    "produce_realization_frame_bytes",
     "realize_alert",
     "realize_attention",
     "select_device",
+    "select_devices_batch",
     "trace_decision",
+    "validate_fact",
+    "validate_intent",
 ]
@@ -0,0 +1,33 @@
+"""JSON codec shared by the wire paths.
+
+Uses orjson when the ``fast`` extra is installed and stdlib json otherwise.
+Encoding always yields UTF-8 bytes and, like stdlib json, accepts non-str
+dict keys. orjson's decode error subclasses json.JSONDecodeError, so callers
+handle a single exception type either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+
+    def json_dumps(payload: Any) -> bytes:
+        """Encode payload as UTF-8 JSON bytes."""
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode JSON from str or UTF-8 bytes."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover
+
+    def json_dumps(payload: Any) -> bytes:
+        """Encode payload as UTF-8 JSON bytes."""
+        return json.dumps(payload).encode()
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode JSON from str or UTF-8 bytes."""
+        return json.loads(data)
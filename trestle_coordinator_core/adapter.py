@@ -20,15 +20,27 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from types import MappingProxyType
 from typing import Any, Protocol
 
+from ._json import json_dumps
+
+# Shared read-only default for fact/intent payloads. dataclasses rejects an
+# unhashable default, so it is handed out through default_factory instead.
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_data() -> Mapping[str, Any]:
+    return _EMPTY_DATA
+
+
 # --------------------------------------------------------------------------
 # Adapter Health
 # --------------------------------------------------------------------------
 
 
-class AdapterHealth(Enum):
+class AdapterHealth(StrEnum):
     """Health status of an ecosystem adapter.
 
     Core uses this to:
@@ -49,7 +61,7 @@ class AdapterHealth(Enum):
 # --------------------------------------------------------------------------
 
 
-class FactType(Enum):
+class FactType(StrEnum):
     """Types of facts that flow INTO core from adapters.
 
     These are ecosystem-agnostic observations about the world.
@@ -76,7 +88,7 @@ class FactType(Enum):
     ADAPTER_HEALTH = "adapter_health"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanonicalFact:
     """A fact flowing from an ecosystem adapter into core.
 
@@ -94,7 +106,7 @@ class CanonicalFact:
     fact_type: FactType
     source_id: str
     timestamp: datetime
-    data: Mapping[str, Any] = field(default_factory=lambda: {})
+    data: Mapping[str, Any] = field(default_factory=_empty_data)
     confidence: float = 1.0
 
     def __post_init__(self) -> None:
@@ -108,7 +120,7 @@ class CanonicalFact:
 # --------------------------------------------------------------------------
 
 
-class IntentType(Enum):
+class IntentType(StrEnum):
     """Types of intents that flow OUT of core to adapters.
 
     These are ecosystem-agnostic commands for the adapter to execute.
@@ -135,7 +147,7 @@ class IntentType(Enum):
     DEACTIVATE_OUTPUT = "deactivate_output"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanonicalIntent:
     """An intent flowing from core to an ecosystem adapter.
 
@@ -154,7 +166,7 @@ class CanonicalIntent:
     intent_type: IntentType
     target_id: str
     timestamp: datetime
-    data: Mapping[str, Any] = field(default_factory=lambda: {})
+    data: Mapping[str, Any] = field(default_factory=_empty_data)
     priority: int = 50
     idempotency_key: str | None = None
 
@@ -379,3 +391,102 @@ INTENT_SCHEMAS: Mapping[IntentType, Mapping[str, type]] = {
         "channel": str,
     },
 }
+
+
+# --------------------------------------------------------------------------
+# Schema Validation
+# --------------------------------------------------------------------------
+
+# Schema fields are optional, so only fields that are present (and not None)
+# are type-checked. Each schema is flattened once into a tuple of
+# (key, accepted types) so validation is a straight loop with no nested
+# dict walks.
+
+_SchemaValidator = Callable[[Mapping[str, Any]], str | None]
+
+
+def _compile_validator(schema: Mapping[str, type]) -> _SchemaValidator:
+    checks = tuple(
+        (key, (float, int) if expected is float else (expected,))
+        for key, expected in schema.items()
+    )
+
+    def validate(data: Mapping[str, Any]) -> str | None:
+        for key, accepted in checks:
+            value = data.get(key)
+            if value is not None and not isinstance(value, accepted):
+                return key
+        return None
+
+    return validate
+
+
+_FACT_VALIDATORS: dict[FactType, _SchemaValidator] = {
+    fact_type: _compile_validator(schema) for fact_type, schema in FACT_SCHEMAS.items()
+}
+
+_INTENT_VALIDATORS: dict[IntentType, _SchemaValidator] = {
+    intent_type: _compile_validator(schema)
+    for intent_type, schema in INTENT_SCHEMAS.items()
+}
+
+
+def validate_fact(fact: CanonicalFact) -> None:
+    """Check fact.data field types against FACT_SCHEMAS.
+
+    Args:
+        fact: The fact to validate.
+
+    Raises:
+        AdapterTranslationError: If a schema field has the wrong type.
+    """
+    bad_key = _FACT_VALIDATORS[fact.fact_type](fact.data)
+    if bad_key is not None:
+        expected = FACT_SCHEMAS[fact.fact_type][bad_key].__name__
+        raise AdapterTranslationError(
+            f"{fact.fact_type.value} fact field {bad_key!r} must be {expected}"
+        )
+
+
+def validate_intent(intent: CanonicalIntent) -> None:
+    """Check intent.data field types against INTENT_SCHEMAS.
+
+    Args:
+        intent: The intent to validate.
+
+    Raises:
+        AdapterTranslationError: If a schema field has the wrong type.
+    """
+    bad_key = _INTENT_VALIDATORS[intent.intent_type](intent.data)
+    if bad_key is not None:
+        expected = INTENT_SCHEMAS[intent.intent_type][bad_key].__name__
+        raise AdapterTranslationError(
+            f"{intent.intent_type.value} intent field {bad_key!r} must be {expected}"
+        )
+
+
+# --------------------------------------------------------------------------
+# Intent Encoding
+# --------------------------------------------------------------------------
+
+
+def encode_intent(intent: CanonicalIntent) -> bytes:
+    """Encode an intent as UTF-8 JSON.
+
+    Args:
+        intent: The intent to encode.
+
+    Returns:
+        JSON bytes with type, target_id, ts, data, priority and
+        idempotency_key.
+    """
+    return json_dumps(
+        {
+            "type": intent.intent_type.value,
+            "target_id": intent.target_id,
+            "ts": intent.timestamp.isoformat(),
+            "data": dict(intent.data),
+            "priority": intent.priority,
+            "idempotency_key": intent.idempotency_key,
+        }
+    )
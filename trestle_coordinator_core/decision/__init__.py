@@ -44,6 +44,7 @@ from .realization_intent import (
     OutputChannel,
     RealizationIntent,
     produce_realization_frame,
+    produce_realization_frame_bytes,
     realize_attention,
 )
 from .selection import (
@@ -52,6 +53,7 @@ from .selection import (
     DeviceContext,
     SelectionResult,
     select_device,
+    select_devices_batch,
 )
 
 __all__ = [
@@ -83,8 +85,10 @@ __all__ = [
     "compute_attention_level_from_device",
     "produce_alert_frame",
     "produce_realization_frame",
+    "produce_realization_frame_bytes",
     "realize_alert",
     "realize_attention",
     "select_device",
+    "select_devices_batch",
     "trace_decision",
 ]
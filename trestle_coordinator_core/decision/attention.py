@@ -17,8 +17,9 @@ Key properties:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import TYPE_CHECKING
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from .selection import DeviceContext
@@ -29,16 +30,16 @@ if TYPE_CHECKING:
 # --------------------------------------------------------------------------
 
 # Life-safety threshold: critical bypass (same as realization module).
-LIFE_SAFETY_THRESHOLD = 150
+LIFE_SAFETY_THRESHOLD: Final = 150
 
 # Interrupt threshold: below this, interruptions are suppressed during quiet hours.
-INTERRUPT_THRESHOLD = 100
+INTERRUPT_THRESHOLD: Final = 100
 
 # Priority thresholds for base attention level mapping.
-PRIORITY_CRITICAL = 150  # Same as LIFE_SAFETY_THRESHOLD
-PRIORITY_INTERRUPT = 100
-PRIORITY_NOTIFY = 50
-PRIORITY_GLANCE = 20
+PRIORITY_CRITICAL: Final = 150  # Same as LIFE_SAFETY_THRESHOLD
+PRIORITY_INTERRUPT: Final = 100
+PRIORITY_NOTIFY: Final = 50
+PRIORITY_GLANCE: Final = 20
 
 
 # --------------------------------------------------------------------------
@@ -46,11 +47,12 @@ PRIORITY_GLANCE = 20
 # --------------------------------------------------------------------------
 
 
-class AttentionLevel(Enum):
+class AttentionLevel(IntEnum):
     """How intrusive an alert should be.
 
     This is the ONLY output of the attention model.
-    Ordered from least to most intrusive.
+    Ordered from least to most intrusive; comparisons are plain int
+    comparisons (PASSIVE=1 … CRITICAL=5).
     """
 
     PASSIVE = auto()  # Background, ambient, no interruption
@@ -59,42 +61,18 @@ class AttentionLevel(Enum):
     INTERRUPT = auto()  # Interrupts current content
     CRITICAL = auto()  # Overrides everything (life safety)
 
-    def __lt__(self, other: object) -> bool:
-        """Enable comparison between attention levels."""
-        if not isinstance(other, AttentionLevel):
-            return NotImplemented
-        return self.value < other.value
-
-    def __le__(self, other: object) -> bool:
-        """Enable comparison between attention levels."""
-        if not isinstance(other, AttentionLevel):
-            return NotImplemented
-        return self.value <= other.value
-
-    def __gt__(self, other: object) -> bool:
-        """Enable comparison between attention levels."""
-        if not isinstance(other, AttentionLevel):
-            return NotImplemented
-        return self.value > other.value
-
-    def __ge__(self, other: object) -> bool:
-        """Enable comparison between attention levels."""
-        if not isinstance(other, AttentionLevel):
-            return NotImplemented
-        return self.value >= other.value
-
-
-# Ordered list for escalation stepping.
-_ATTENTION_ORDER = [
+
+# Levels by index (value - 1), for converting int levels back to members.
+_ATTENTION_ORDER = (
     AttentionLevel.PASSIVE,
     AttentionLevel.GLANCE,
     AttentionLevel.NOTIFY,
     AttentionLevel.INTERRUPT,
     AttentionLevel.CRITICAL,
-]
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AttentionContext:
     """All inputs for computing attention level.
 
@@ -134,11 +112,13 @@ class AttentionContext:
 # --------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
 def compute_attention_level(context: AttentionContext) -> AttentionLevel:
     """Compute the appropriate attention level for an alert.
 
     This is a pure, deterministic function with no side effects.
-    It implements the formal attention/interruption model.
+    It implements the formal attention/interruption model. Because it is
+    pure and AttentionContext is frozen, results are memoized per context.
 
     Decision rules (in order):
     1. Critical bypass: priority >= LIFE_SAFETY_THRESHOLD → CRITICAL
@@ -163,27 +143,33 @@ def compute_attention_level(context: AttentionContext) -> AttentionLevel:
     if context.cooldown_active and context.escalation_level == 0:
         return AttentionLevel.PASSIVE
 
+    # Rules 3-7 run on plain ints (level values 1-5) and convert back once.
+
     # Rule 3: Compute base attention level from priority.
-    level = _base_attention_from_priority(context.alert_priority)
+    level = _PRIORITY_TO_LEVEL[min(max(context.alert_priority, 0), _MAX_PRIORITY)]
 
     # Rule 4: Apply escalation (each level increases by one step).
-    level = _apply_escalation(level, context.escalation_level)
+    if context.escalation_level > 0:
+        level += context.escalation_level
 
     # Rule 5: Device presence modulation.
     # If user is nearby and device was recently active, allow higher attention.
     if context.device_proximity_near and context.device_recently_active:
-        level = _step_up(level)
+        level += 1
+
+    # Rules 4-5 saturate at CRITICAL.
+    level = min(level, AttentionLevel.CRITICAL)
 
     # Rule 6: Ambient-only devices cap at GLANCE.
     if not context.device_supports_interruptions:
-        level = _cap_at(level, AttentionLevel.GLANCE)
+        level = min(level, AttentionLevel.GLANCE)
 
     # Rule 7: Quiet hours gating - cap at NOTIFY unless critical.
     # (Critical already handled in Rule 1)
-    if context.quiet_hours and level > AttentionLevel.NOTIFY:
-        level = AttentionLevel.NOTIFY
+    if context.quiet_hours:
+        level = min(level, AttentionLevel.NOTIFY)
 
-    return level
+    return _ATTENTION_ORDER[level - 1]
 
 
 def compute_attention_level_from_device(
@@ -215,8 +201,10 @@ def compute_attention_level_from_device(
 
     # Extract device signals with safe defaults.
     # Missing signals are treated as "unknown" (conservative defaults).
-    device_present = bool(signals.get("proximity_active", True))
+    # proximity_active feeds both flags: a missing key means "present but
+    # not near", so the membership test only runs when proximity is falsy.
     device_proximity_near = bool(signals.get("proximity_active", False))
+    device_present = device_proximity_near or "proximity_active" not in signals
     device_supports_interruptions = bool(signals.get("supports_interruptions", True))
     device_recently_active = bool(signals.get("recently_active", False))
 
@@ -261,28 +249,9 @@ def _base_attention_from_priority(priority: int) -> AttentionLevel:
     return AttentionLevel.PASSIVE
 
 
-def _apply_escalation(level: AttentionLevel, escalation_level: int) -> AttentionLevel:
-    """Apply escalation steps to attention level.
-
-    Each escalation level increases attention by one step, up to CRITICAL.
-    """
-    if escalation_level <= 0:
-        return level
-
-    current_idx = _ATTENTION_ORDER.index(level)
-    new_idx = min(current_idx + escalation_level, len(_ATTENTION_ORDER) - 1)
-    return _ATTENTION_ORDER[new_idx]
-
-
-def _step_up(level: AttentionLevel) -> AttentionLevel:
-    """Increase attention level by one step (max CRITICAL)."""
-    current_idx = _ATTENTION_ORDER.index(level)
-    new_idx = min(current_idx + 1, len(_ATTENTION_ORDER) - 1)
-    return _ATTENTION_ORDER[new_idx]
-
-
-def _cap_at(level: AttentionLevel, cap: AttentionLevel) -> AttentionLevel:
-    """Cap attention level at a maximum."""
-    if level > cap:
-        return cap
-    return level
+# Base level value for every priority 0-199, so Rule 3 is one index.
+# Priorities are clamped into this range before lookup.
+_MAX_PRIORITY: Final = 199
+_PRIORITY_TO_LEVEL = bytes(
+    _base_attention_from_priority(p) for p in range(_MAX_PRIORITY + 1)
+)
@@ -15,8 +15,10 @@ Maps to trestle.proto Alert message with RealizationHints.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
+from .._json import json_dumps
 from .realization import RealizationMode, RealizationResult
 
 # --------------------------------------------------------------------------
@@ -24,11 +26,12 @@ from .realization import RealizationMode, RealizationResult
 # --------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RealizationHints:
     """Coordinator-provided hints for how device should present alert.
 
-    Maps to proto RealizationHints message.
+    Maps to proto RealizationHints message. Frozen: produced frames share
+    one instance per (mode, interrupt, severity) combination.
     """
 
     audible: bool = False
@@ -38,7 +41,7 @@ class RealizationHints:
     display_summary: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertAction:
     """Action button for alert.
 
@@ -50,7 +53,7 @@ class AlertAction:
     is_destructive: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertFrame:
     """ICD-compatible alert frame for device consumption.
 
@@ -109,6 +112,14 @@ class AlertFrame:
             "timestamp": self.timestamp,
         }
 
+    def encode(self) -> bytes:
+        """Encode the wire form of this frame as UTF-8 JSON.
+
+        Uses orjson when the ``fast`` extra is installed, stdlib json
+        otherwise. The result can be sent as a TEXT frame as-is.
+        """
+        return json_dumps(self.to_proto_dict())
+
 
 # --------------------------------------------------------------------------
 # Frame Producer
@@ -147,10 +158,10 @@ def produce_alert_frame(
         return None
 
     # Map severity to proto AlertStyle.
-    style = _severity_to_style(result.severity)
+    style = _STYLE_BY_SEVERITY.get(result.severity, "INFORMATIONAL")
 
     # Build realization hints based on decision.
-    hints = _build_hints(result)
+    hints = _build_hints(result.mode, result.interrupt, result.severity)
 
     return AlertFrame(
         alert_id=alert_id,
@@ -172,38 +183,38 @@ def produce_alert_frame(
 # --------------------------------------------------------------------------
 
 
-def _severity_to_style(severity: str) -> str:
-    """Map severity to proto AlertStyle enum value."""
-    if severity == "critical":
-        return "CRITICAL"
-    if severity == "warning":
-        return "WARNING"
-    return "INFORMATIONAL"
+# Severity → proto AlertStyle; anything else is INFORMATIONAL.
+_STYLE_BY_SEVERITY: dict[str, str] = {
+    "critical": "CRITICAL",
+    "warning": "WARNING",
+}
+
+# Mode → (visual urgency, audible on interrupt, haptic on interrupt).
+# Modes not listed are AMBIENT and silent.
+_HINTS_BY_MODE: dict[RealizationMode, tuple[str, bool, bool]] = {
+    RealizationMode.FULLSCREEN: ("URGENT", True, True),
+    RealizationMode.BANNER: ("ATTENTION", True, False),
+}
+_AMBIENT_HINTS = ("AMBIENT", False, False)
 
 
-def _build_hints(result: RealizationResult) -> RealizationHints:
-    """Build RealizationHints from RealizationResult."""
+@lru_cache(maxsize=16)
+def _build_hints(
+    mode: RealizationMode, interrupt: bool, severity: str
+) -> RealizationHints:
+    """Build RealizationHints from the RealizationResult fields they depend on."""
     # Determine visual urgency from mode.
-    if result.mode == RealizationMode.FULLSCREEN:
-        visual_urgency = "URGENT"
-        audible = result.interrupt
-        haptic = result.interrupt
-    elif result.mode == RealizationMode.BANNER:
-        visual_urgency = "ATTENTION"
-        audible = result.interrupt
-        haptic = False
-    else:
-        visual_urgency = "AMBIENT"
-        audible = False
-        haptic = False
+    visual_urgency, audible, haptic = _HINTS_BY_MODE.get(mode, _AMBIENT_HINTS)
 
     # Respect DND unless life-safety.
-    respect_dnd = result.severity != "critical"
+    respect_dnd = severity != "critical"
 
     return RealizationHints(
-        audible=audible,
-        haptic=haptic,
+        audible=audible and interrupt,
+        haptic=haptic and interrupt,
         visual_urgency=visual_urgency,
         respect_dnd=respect_dnd,
-        display_summary=None,  # Coordinator may populate later.
+        # Hints are frozen and shared between frames; callers that need a
+        # display_summary derive new hints with dataclasses.replace.
+        display_summary=None,
     )
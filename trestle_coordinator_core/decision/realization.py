@@ -22,7 +22,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from enum import Enum
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -77,7 +78,7 @@ class EscalationReason(str, Enum):
 # --------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionContext:
     """All inputs required for a single alert realization decision.
 
@@ -127,13 +128,16 @@ class DecisionContext:
     trigger_count: int = 0
     escalation_threshold: int = 3
 
+    # Observability: record priority_adjustments on the result.
+    debug_trace: bool = False
+
 
 # --------------------------------------------------------------------------
 # Realization Result (Decision Output)
 # --------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class RealizationResult:
     """The outcome of an alert realization decision.
 
@@ -165,7 +169,7 @@ class RealizationResult:
     suppression_reasons: list[SuppressionReason] = field(default_factory=lambda: [])
     escalation_reasons: list[EscalationReason] = field(default_factory=lambda: [])
 
-    # Final adjusted values for debugging.
+    # Final adjusted values for debugging (only with context.debug_trace).
     priority_adjustments: list[str] = field(default_factory=lambda: [])
 
 
@@ -174,7 +178,7 @@ class RealizationResult:
 # --------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionTrace:
     """Debug trace of a realization decision.
 
@@ -231,74 +235,105 @@ def realize_alert(context: DecisionContext) -> RealizationResult:
     Returns:
         RealizationResult with what should happen.
     """
-    suppression_reasons: list[SuppressionReason] = []
+    return _decide(context, None, None)
+
+
+def _decide(
+    context: DecisionContext,
+    steps: list[str] | None,
+    in_quiet_hours: bool | None,
+) -> RealizationResult:
+    """Run the realization decision, optionally recording trace steps.
+
+    realize_alert and trace_decision share this one implementation, so a
+    trace always explains the decision realize_alert actually makes.
+
+    Args:
+        context: Complete decision context.
+        steps: List to append human-readable steps to, or None.
+        in_quiet_hours: Precomputed quiet-hours check, or None to evaluate
+            it only if quiet hours can suppress the alert.
+
+    Returns:
+        RealizationResult with what should happen.
+    """
     escalation_reasons: list[EscalationReason] = []
+    # The adjustments trail is formatted only when asked for.
+    debug = context.debug_trace
     priority_adjustments: list[str] = []
 
     # Start with base priority from policy.
     computed_priority = context.policy_base_priority
-    priority_adjustments.append(f"base: {computed_priority}")
+    if debug:
+        priority_adjustments.append(f"base: {computed_priority}")
 
     # Override with alert's own priority if provided.
     if context.base_priority > 0:
         computed_priority = context.base_priority
-        priority_adjustments.append(f"alert_base: {computed_priority}")
+        if debug:
+            priority_adjustments.append(f"alert_base: {computed_priority}")
 
     # Step 1: Capability enabled?
+    if steps is not None:
+        steps.append(f"1. Capability enabled: {context.capability_enabled}")
     if not context.capability_enabled:
-        suppression_reasons.append(SuppressionReason.CAPABILITY_DISABLED)
         return _suppressed_result(
+            SuppressionReason.CAPABILITY_DISABLED,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
 
     # Step 2: User visibility preference.
+    if steps is not None:
+        steps.append(f"2. Visibility preference: {context.visibility_preference}")
     if context.visibility_preference == "never":
-        suppression_reasons.append(SuppressionReason.USER_PREFERENCE_NEVER)
         return _suppressed_result(
+            SuppressionReason.USER_PREFERENCE_NEVER,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
 
     # Step 3: Alert preference.
+    if steps is not None:
+        steps.append(f"3. Alert preference: {context.alert_preference}")
     if context.alert_preference == "disabled":
-        suppression_reasons.append(SuppressionReason.ALERT_PREFERENCE_DISABLED)
         return _suppressed_result(
+            SuppressionReason.ALERT_PREFERENCE_DISABLED,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
 
     # Step 4: Policy enabled?
+    if steps is not None:
+        steps.append(f"4. Policy enabled: {context.policy_enabled}")
     if not context.policy_enabled:
-        suppression_reasons.append(SuppressionReason.DOMAIN_DISABLED)
         return _suppressed_result(
+            SuppressionReason.DOMAIN_DISABLED,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
 
     # Step 5: Domain/room disabled?
+    if steps is not None:
+        steps.append(f"5. Domain policy: {_policy_repr(context.domain_policy)}")
     if not context.domain_policy.get("enabled", True):
-        suppression_reasons.append(SuppressionReason.DOMAIN_DISABLED)
         return _suppressed_result(
+            SuppressionReason.DOMAIN_DISABLED,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
 
+    if steps is not None:
+        steps.append(f"6. Room policy: {_policy_repr(context.room_policy)}")
     if context.room_id and not context.room_policy.get("enabled", True):
-        suppression_reasons.append(SuppressionReason.ROOM_DISABLED)
         return _suppressed_result(
+            SuppressionReason.ROOM_DISABLED,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
@@ -307,44 +342,63 @@ def realize_alert(context: DecisionContext) -> RealizationResult:
     domain_boost = context.domain_policy.get("priority_boost", 0)
     if domain_boost:
         computed_priority = max(1, min(199, computed_priority + domain_boost))
-        priority_adjustments.append(f"domain_boost: {domain_boost:+d}")
+        if debug:
+            priority_adjustments.append(f"domain_boost: {domain_boost:+d}")
 
     room_boost = context.room_policy.get("priority_boost", 0)
     if room_boost:
         computed_priority = max(1, min(199, computed_priority + room_boost))
-        priority_adjustments.append(f"room_boost: {room_boost:+d}")
+        if debug:
+            priority_adjustments.append(f"room_boost: {room_boost:+d}")
+
+    if steps is not None:
+        steps.append(
+            f"7. Priority computation: base={context.base_priority}, "
+            f"domain_boost={domain_boost}, room_boost={room_boost}, "
+            f"computed={computed_priority}"
+        )
 
     # Step 7: Quiet hours check (life-safety bypasses).
     is_life_safety = computed_priority >= LIFE_SAFETY_THRESHOLD
-    in_quiet_hours = _is_in_quiet_hours(
-        context.current_time,
-        context.quiet_hours_start,
-        context.quiet_hours_end,
-    )
+    # Quiet hours can only suppress when the user opted in and the alert is
+    # not life-safety, so the window is only evaluated then (traces pass it in).
+    quiet_hours_apply = context.quiet_hours_preference and not is_life_safety
+    if in_quiet_hours is None:
+        in_quiet_hours = quiet_hours_apply and _is_in_quiet_hours(
+            context.current_time,
+            context.quiet_hours_start,
+            context.quiet_hours_end,
+        )
+    if steps is not None:
+        steps.append(f"8. Life-safety: {is_life_safety}")
+        steps.append(f"9. In quiet hours: {in_quiet_hours}")
 
-    if in_quiet_hours and not is_life_safety and context.quiet_hours_preference:
+    if quiet_hours_apply and in_quiet_hours:
         # User has quiet hours enabled for this capability.
-        suppression_reasons.append(SuppressionReason.QUIET_HOURS)
         return _suppressed_result(
+            SuppressionReason.QUIET_HOURS,
             computed_priority,
-            suppression_reasons,
             escalation_reasons,
             priority_adjustments,
         )
 
     if is_life_safety:
         escalation_reasons.append(EscalationReason.LIFE_SAFETY)
-        priority_adjustments.append("life_safety_bypass")
+        if debug:
+            priority_adjustments.append("life_safety_bypass")
+        if steps is not None:
+            steps.append("   → Life-safety bypasses quiet hours")
 
     # Step 8: Cooldown check.
     cooldown = context.domain_policy.get("cooldown_seconds", context.cooldown_seconds)
     if cooldown > 0 and context.last_triggered:
         elapsed = (context.current_time - context.last_triggered).total_seconds()
+        if steps is not None:
+            steps.append(f"   → Cooldown: {elapsed:.0f}s of {cooldown}s elapsed")
         if elapsed < cooldown:
-            suppression_reasons.append(SuppressionReason.COOLDOWN_ACTIVE)
             return _suppressed_result(
+                SuppressionReason.COOLDOWN_ACTIVE,
                 computed_priority,
-                suppression_reasons,
                 escalation_reasons,
                 priority_adjustments,
             )
@@ -354,14 +408,22 @@ def realize_alert(context: DecisionContext) -> RealizationResult:
         # Boost priority for repeated triggers.
         escalation_boost = min(50, context.trigger_count * 10)
         computed_priority = min(199, computed_priority + escalation_boost)
-        priority_adjustments.append(f"escalation: +{escalation_boost}")
+        if debug:
+            priority_adjustments.append(f"escalation: +{escalation_boost}")
         escalation_reasons.append(EscalationReason.REPEATED_TRIGGER)
+        if steps is not None:
+            steps.append(
+                f"   → Repeated triggers: {context.trigger_count}, "
+                f"escalation=+{escalation_boost}, computed={computed_priority}"
+            )
 
-    # Step 10: Determine mode based on priority.
-    mode = _priority_to_mode(computed_priority)
-
-    # Step 11: Determine severity.
-    severity = _priority_to_severity(computed_priority)
+    # Steps 10, 11 and 13: mode, severity and expiry follow from priority
+    # alone, so all three come from one precomputed table entry.
+    mode, severity, expires_seconds = _OUTCOME_BY_PRIORITY[
+        min(max(computed_priority, 0), _MAX_PRIORITY)
+    ]
+    if steps is not None:
+        steps.append(f"10. Mode selection: {mode.value}")
 
     # Step 12: Determine interrupt behavior.
     # Interrupt only if allowed by user and priority warrants it.
@@ -371,17 +433,6 @@ def realize_alert(context: DecisionContext) -> RealizationResult:
         and context.alert_preference != "silent"
     )
 
-    # Step 13: Determine expiry.
-    # Higher priority alerts persist longer.
-    if computed_priority >= LIFE_SAFETY_THRESHOLD:
-        expires_seconds = 0  # Never auto-expire life-safety.
-    elif computed_priority >= 100:
-        expires_seconds = 300  # 5 minutes.
-    elif computed_priority >= 50:
-        expires_seconds = 120  # 2 minutes.
-    else:
-        expires_seconds = 30  # 30 seconds for low priority.
-
     # Step 14: Build result.
     return RealizationResult(
         realized=True,
@@ -391,7 +442,6 @@ def realize_alert(context: DecisionContext) -> RealizationResult:
         interrupt=interrupt,
         expires_seconds=expires_seconds,
         notification_center_eligible=mode != RealizationMode.SUPPRESSED,
-        suppression_reasons=suppression_reasons,
         escalation_reasons=escalation_reasons,
         priority_adjustments=priority_adjustments,
     )
@@ -409,98 +459,24 @@ def trace_decision(context: DecisionContext) -> DecisionTrace:
     - Why was this alert suppressed?
     - Why was this escalated?
 
+    The trace is recorded by the same decision path as realize_alert, so
+    its outcome always matches the real decision.
+
     Args:
         context: The decision context.
 
     Returns:
         DecisionTrace with step-by-step explanation.
     """
-    steps: list[str] = []
-    suppression_reasons: list[str] = []
-    escalation_reasons: list[str] = []
-
-    # Determine quiet hours status first.
+    # The trace reports the quiet-hours window even when an earlier step
+    # suppresses the alert, so it is evaluated once up front.
     in_quiet_hours = _is_in_quiet_hours(
         context.current_time,
         context.quiet_hours_start,
         context.quiet_hours_end,
     )
-
-    # Run through decision steps.
-    steps.append(f"1. Capability enabled: {context.capability_enabled}")
-    if not context.capability_enabled:
-        suppression_reasons.append("capability_disabled")
-        return DecisionTrace(
-            alert_id=context.alert_id,
-            timestamp=context.current_time.isoformat(),
-            base_priority=context.base_priority,
-            capability_enabled=context.capability_enabled,
-            visibility_preference=context.visibility_preference,
-            alert_preference=context.alert_preference,
-            in_quiet_hours=in_quiet_hours,
-            steps=steps,
-            realized=False,
-            suppression_reasons=suppression_reasons,
-        )
-
-    steps.append(f"2. Visibility preference: {context.visibility_preference}")
-    if context.visibility_preference == "never":
-        suppression_reasons.append("user_preference_never")
-        return DecisionTrace(
-            alert_id=context.alert_id,
-            timestamp=context.current_time.isoformat(),
-            base_priority=context.base_priority,
-            capability_enabled=context.capability_enabled,
-            visibility_preference=context.visibility_preference,
-            alert_preference=context.alert_preference,
-            in_quiet_hours=in_quiet_hours,
-            steps=steps,
-            realized=False,
-            suppression_reasons=suppression_reasons,
-        )
-
-    steps.append(f"3. Alert preference: {context.alert_preference}")
-    if context.alert_preference == "disabled":
-        suppression_reasons.append("alert_preference_disabled")
-        return DecisionTrace(
-            alert_id=context.alert_id,
-            timestamp=context.current_time.isoformat(),
-            base_priority=context.base_priority,
-            capability_enabled=context.capability_enabled,
-            visibility_preference=context.visibility_preference,
-            alert_preference=context.alert_preference,
-            in_quiet_hours=in_quiet_hours,
-            steps=steps,
-            realized=False,
-            suppression_reasons=suppression_reasons,
-        )
-
-    steps.append(f"4. Policy enabled: {context.policy_enabled}")
-    steps.append(f"5. Domain policy: {dict(context.domain_policy)}")
-    steps.append(f"6. Room policy: {dict(context.room_policy)}")
-
-    # Compute final priority.
-    computed = context.base_priority or context.policy_base_priority
-    domain_boost = context.domain_policy.get("priority_boost", 0)
-    room_boost = context.room_policy.get("priority_boost", 0)
-    computed = max(1, min(199, computed + domain_boost + room_boost))
-
-    steps.append(
-        f"7. Priority computation: base={context.base_priority}, "
-        f"domain_boost={domain_boost}, room_boost={room_boost}, "
-        f"computed={computed}"
-    )
-
-    is_life_safety = computed >= LIFE_SAFETY_THRESHOLD
-    steps.append(f"8. Life-safety: {is_life_safety}")
-    steps.append(f"9. In quiet hours: {in_quiet_hours}")
-
-    if is_life_safety:
-        escalation_reasons.append("life_safety")
-        steps.append("   → Life-safety bypasses quiet hours")
-
-    mode = _priority_to_mode(computed)
-    steps.append(f"10. Mode selection: {mode.value}")
+    steps: list[str] = []
+    result = _decide(context, steps, in_quiet_hours)
 
     return DecisionTrace(
         alert_id=context.alert_id,
@@ -511,11 +487,11 @@ def trace_decision(context: DecisionContext) -> DecisionTrace:
         alert_preference=context.alert_preference,
         in_quiet_hours=in_quiet_hours,
         steps=steps,
-        realized=True,
-        mode=mode.value,
-        computed_priority=computed,
-        suppression_reasons=suppression_reasons,
-        escalation_reasons=escalation_reasons,
+        realized=result.realized,
+        mode=result.mode.value,
+        computed_priority=result.computed_priority,
+        suppression_reasons=[reason.value for reason in result.suppression_reasons],
+        escalation_reasons=[reason.value for reason in result.escalation_reasons],
     )
 
 
@@ -525,12 +501,16 @@ def trace_decision(context: DecisionContext) -> DecisionTrace:
 
 
 def _suppressed_result(
+    reason: SuppressionReason,
     computed_priority: int,
-    suppression_reasons: list[SuppressionReason],
     escalation_reasons: list[EscalationReason],
     priority_adjustments: list[str],
 ) -> RealizationResult:
-    """Build a suppressed RealizationResult."""
+    """Build a suppressed RealizationResult for a single suppression reason.
+
+    Every suppression short-circuits the decision, so the reasons list is
+    only ever built here, with its one entry.
+    """
     return RealizationResult(
         realized=False,
         mode=RealizationMode.SUPPRESSED,
@@ -539,7 +519,7 @@ def _suppressed_result(
         interrupt=False,
         expires_seconds=0,
         notification_center_eligible=False,
-        suppression_reasons=suppression_reasons,
+        suppression_reasons=[reason],
         escalation_reasons=escalation_reasons,
         priority_adjustments=priority_adjustments,
     )
@@ -565,6 +545,34 @@ def _priority_to_severity(priority: int) -> str:
     return "info"
 
 
+def _priority_to_expiry(priority: int) -> int:
+    """Map priority to auto-expiry seconds (0 = never).
+
+    Higher priority alerts persist longer.
+    """
+    if priority >= LIFE_SAFETY_THRESHOLD:
+        return 0  # Never auto-expire life-safety.
+    if priority >= 100:
+        return 300  # 5 minutes.
+    if priority >= 50:
+        return 120  # 2 minutes.
+    return 30  # 30 seconds for low priority.
+
+
+# (mode, severity, expiry) for every priority 0-199, so the priority-driven
+# steps are one index. Priorities are clamped into this range before lookup.
+_MAX_PRIORITY: Final = 199
+_OUTCOME_BY_PRIORITY: tuple[tuple[RealizationMode, str, int], ...] = tuple(
+    (_priority_to_mode(p), _priority_to_severity(p), _priority_to_expiry(p))
+    for p in range(_MAX_PRIORITY + 1)
+)
+
+
+def _policy_repr(policy: Mapping[str, Any]) -> str:
+    """Format a policy mapping as a dict, copying only non-dict mappings."""
+    return repr(policy if type(policy) is dict else dict(policy))
+
+
 def _is_in_quiet_hours(
     current_time: datetime,
     start: str | None,
@@ -577,13 +585,10 @@ def _is_in_quiet_hours(
     if not start or not end:
         return False
 
-    try:
-        start_parts = start.split(":")
-        end_parts = end.split(":")
-        start_time = time(int(start_parts[0]), int(start_parts[1]))
-        end_time = time(int(end_parts[0]), int(end_parts[1]))
-    except (ValueError, IndexError):
+    bounds = _parse_quiet_hours(start, end)
+    if bounds is None:
         return False
+    start_time, end_time = bounds
 
     current = current_time.time()
 
@@ -594,3 +599,19 @@ def _is_in_quiet_hours(
 
     # Normal range (e.g., 23:00 - 06:00 same day).
     return start_time <= current <= end_time
+
+
+@lru_cache(maxsize=64)
+def _parse_quiet_hours(start: str, end: str) -> tuple[time, time] | None:
+    """Parse "HH:MM" quiet-hours bounds, or None if either is malformed.
+
+    Cached: a policy snapshot reuses the same pair for every decision.
+    """
+    try:
+        start_parts = start.split(":")
+        end_parts = end.split(":")
+        start_time = time(int(start_parts[0]), int(start_parts[1]))
+        end_time = time(int(end_parts[0]), int(end_parts[1]))
+    except (ValueError, IndexError):
+        return None
+    return start_time, end_time
@@ -17,8 +17,10 @@ Properties:
 from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from itertools import product
 from typing import Any, Literal
 
+from .._json import json_dumps
 from .attention import AttentionLevel
 from .selection import DeviceContext
 
@@ -45,7 +47,7 @@ class OutputChannel(Enum):
 # --------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RealizationIntent:
     """Abstract output intent for a single channel.
 
@@ -83,27 +85,27 @@ class RealizationIntent:
 # This is policy, not user-configurable (yet).
 # Device capabilities filter these, never modify the attention level.
 
-REALIZATION_PROFILES: Mapping[AttentionLevel, list[RealizationIntent]] = {
+REALIZATION_PROFILES: Mapping[AttentionLevel, tuple[RealizationIntent, ...]] = {
     # PASSIVE: Ambient only, low intensity, non-persistent
-    AttentionLevel.PASSIVE: [
+    AttentionLevel.PASSIVE: (
         RealizationIntent(
             channel=OutputChannel.AMBIENT,
             intensity="low",
             persistent=False,
             interruptive=False,
         ),
-    ],
+    ),
     # GLANCE: Visual only, low intensity, non-interruptive
-    AttentionLevel.GLANCE: [
+    AttentionLevel.GLANCE: (
         RealizationIntent(
             channel=OutputChannel.VISUAL,
             intensity="low",
             persistent=False,
             interruptive=False,
         ),
-    ],
+    ),
     # NOTIFY: Visual (medium, persistent) + Audio (low, non-interruptive)
-    AttentionLevel.NOTIFY: [
+    AttentionLevel.NOTIFY: (
         RealizationIntent(
             channel=OutputChannel.VISUAL,
             intensity="medium",
@@ -116,9 +118,9 @@ REALIZATION_PROFILES: Mapping[AttentionLevel, list[RealizationIntent]] = {
             persistent=False,
             interruptive=False,
         ),
-    ],
+    ),
     # INTERRUPT: Visual (high, interruptive) + Audio (medium) + Haptic (medium)
-    AttentionLevel.INTERRUPT: [
+    AttentionLevel.INTERRUPT: (
         RealizationIntent(
             channel=OutputChannel.VISUAL,
             intensity="high",
@@ -137,9 +139,9 @@ REALIZATION_PROFILES: Mapping[AttentionLevel, list[RealizationIntent]] = {
             persistent=False,
             interruptive=True,
         ),
-    ],
+    ),
     # CRITICAL: All channels, high intensity, interruptive, persistent
-    AttentionLevel.CRITICAL: [
+    AttentionLevel.CRITICAL: (
         RealizationIntent(
             channel=OutputChannel.VISUAL,
             intensity="high",
@@ -158,7 +160,7 @@ REALIZATION_PROFILES: Mapping[AttentionLevel, list[RealizationIntent]] = {
             persistent=True,
             interruptive=True,
         ),
-    ],
+    ),
 }
 
 
@@ -191,17 +193,26 @@ def realize_attention(
         - Deterministic (same inputs → identical output)
         - No IO, no timing, no HA calls
     """
-    # Get baseline intents for this attention level
-    baseline = REALIZATION_PROFILES.get(attention, [])
-
     # Extract device capability signals
     signals = device.signals
-    supports_audio = signals.get("supports_audio", True)
-    supports_haptic = signals.get("supports_haptic", False)
-    supports_ambient = signals.get("supports_ambient", False)
+    key = (
+        attention,
+        bool(signals.get("supports_audio", True)),
+        bool(signals.get("supports_haptic", False)),
+        bool(signals.get("supports_ambient", False)),
+    )
     # Visual is always assumed supported
 
-    # Filter intents based on device capabilities
+    return list(_FILTERED_PROFILES.get(key, ()))
+
+
+def _filter_intents(
+    baseline: tuple[RealizationIntent, ...],
+    supports_audio: bool,
+    supports_haptic: bool,
+    supports_ambient: bool,
+) -> tuple[RealizationIntent, ...]:
+    """Drop intents for channels the device does not support."""
     filtered: list[RealizationIntent] = []
     for intent in baseline:
         if intent.channel == OutputChannel.AUDIO and not supports_audio:
@@ -212,8 +223,21 @@ def realize_attention(
             continue
         # VISUAL always passes through
         filtered.append(intent)
-
-    return filtered
+    # Nothing dropped: share the profile tuple itself.
+    return baseline if len(filtered) == len(baseline) else tuple(filtered)
+
+
+# The profiles are static and only three capability signals filter them, so
+# every (attention, audio, haptic, ambient) outcome is precomputed at import.
+_FILTERED_PROFILES: dict[
+    tuple[AttentionLevel, bool, bool, bool], tuple[RealizationIntent, ...]
+] = {
+    (attention, audio, haptic, ambient): _filter_intents(
+        baseline, audio, haptic, ambient
+    )
+    for attention, baseline in REALIZATION_PROFILES.items()
+    for audio, haptic, ambient in product((False, True), repeat=3)
+}
 
 
 # --------------------------------------------------------------------------
@@ -244,3 +268,24 @@ def produce_realization_frame(
         "attention": attention.name,
         "outputs": [intent.to_dict() for intent in intents],
     }
+
+
+def produce_realization_frame_bytes(
+    alert_id: str,
+    attention: AttentionLevel,
+    intents: list[RealizationIntent],
+) -> bytes:
+    """Produce the realization frame encoded as UTF-8 JSON.
+
+    Same frame as produce_realization_frame, serialized with orjson when
+    the ``fast`` extra is installed.
+
+    Args:
+        alert_id: Unique identifier for the alert.
+        attention: The attention level being realized.
+        intents: Filtered realization intents.
+
+    Returns:
+        JSON bytes ready to send as a TEXT frame.
+    """
+    return json_dumps(produce_realization_frame(alert_id, attention, intents))
@@ -50,7 +50,7 @@ SCORE_SCREEN_FACING = 20
 # --------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceContext:
     """Runtime context for a device during selection.
 
@@ -91,7 +91,7 @@ class DeviceContext:
     signals: Mapping[str, Any] = field(default_factory=lambda: {})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SelectionResult:
     """Result of device selection.
 
@@ -108,7 +108,7 @@ class SelectionResult:
     candidates_evaluated: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlertTarget:
     """Alert targeting information for device selection.
 
@@ -123,7 +123,7 @@ class AlertTarget:
     excluded_devices: frozenset[str] = field(default_factory=lambda: frozenset())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceCapabilities:
     """Device capabilities for eligibility checking.
 
@@ -165,18 +165,61 @@ def select_device(
     Returns:
         SelectionResult with selected device_id, or None if no device qualifies.
     """
-    # Step 1: Filter to eligible devices.
-    eligible: list[tuple[DeviceContext, DeviceCapabilities]] = []
+    pool = _build_pool(devices, capabilities, current_time)
+    return _select_from_pool(target, pool, current_time)
+
+
+def select_devices_batch(
+    targets: Sequence[AlertTarget],
+    devices: Sequence[DeviceContext],
+    capabilities: Mapping[str, DeviceCapabilities],
+    current_time: float,
+) -> list[SelectionResult]:
+    """Select the best device for each of several alerts over one device pool.
+
+    Equivalent to calling select_device once per target, but the
+    target-independent work (online/suppression filtering, recency and
+    signal scoring, tie-break keys) is done once for the whole batch.
+
+    Args:
+        targets: Alert targeting information, one per alert.
+        devices: List of device contexts to consider.
+        capabilities: Device capabilities indexed by device_id.
+        current_time: Current Unix timestamp for recency calculations.
+
+    Returns:
+        One SelectionResult per target, in target order.
+    """
+    pool = _build_pool(devices, capabilities, current_time)
+    return [_select_from_pool(target, pool, current_time) for target in targets]
+
+
+# Pool entry: (device, capabilities, target-independent score, tie-break elapsed).
+_PoolEntry = tuple[DeviceContext, DeviceCapabilities, int, float]
+
+
+def _build_pool(
+    devices: Sequence[DeviceContext],
+    capabilities: Mapping[str, DeviceCapabilities],
+    current_time: float,
+) -> list[_PoolEntry]:
+    """Filter and pre-score devices independently of any alert target.
+
+    Args:
+        devices: List of device contexts to consider.
+        capabilities: Device capabilities indexed by device_id.
+        current_time: Current Unix timestamp.
+
+    Returns:
+        Pool entries for devices that are online, known and not suppressed.
+    """
+    pool: list[_PoolEntry] = []
 
     for device in devices:
         # Must be online.
         if not device.online:
             continue
 
-        # Must not be explicitly excluded.
-        if device.device_id in target.excluded_devices:
-            continue
-
         # Get device capabilities.
         caps = capabilities.get(device.device_id)
         if caps is None:
@@ -187,34 +230,69 @@ def select_device(
         if caps.suppressed:
             continue
 
+        elapsed, _device_id = _tie_break_key(device, current_time)
+        pool.append(
+            (device, caps, _compute_context_score(device, current_time), elapsed)
+        )
+
+    return pool
+
+
+def _select_from_pool(
+    target: AlertTarget,
+    pool: Sequence[_PoolEntry],
+    current_time: float,
+) -> SelectionResult:
+    """Apply target-specific eligibility and scoring to a device pool.
+
+    Args:
+        target: Alert targeting information.
+        pool: Pre-scored devices from _build_pool.
+        current_time: Current Unix timestamp.
+
+    Returns:
+        SelectionResult for the target.
+    """
+    excluded = target.excluded_devices
+    # An empty requirement is met by every device; skip the subset check.
+    required = target.required_capabilities or None
+    room_id = target.room_id
+
+    # Rank eligible devices as plain rows: (-score, tie-break elapsed,
+    # device_id, index). The index keeps input order as the last resort
+    # and points back at the device.
+    candidates: list[DeviceContext] = []
+    rows: list[tuple[int, float, str, int]] = []
+
+    for device, caps, base_score, elapsed in pool:
+        # Must not be explicitly excluded.
+        if device.device_id in excluded:
+            continue
+
         # Device must have all required capabilities.
-        if target.required_capabilities and not target.required_capabilities.issubset(
-            caps.capabilities
-        ):
+        if required is not None and not required <= caps.capabilities:
             continue
 
-        eligible.append((device, caps))
+        score = base_score + _compute_room_score(device, room_id)
+        rows.append((-score, elapsed, device.device_id, len(candidates)))
+        candidates.append(device)
 
-    if not eligible:
+    if not candidates:
         return SelectionResult(device_id=None, candidates_evaluated=0)
 
-    # Step 2: Score each eligible device.
-    scored: list[tuple[DeviceContext, int, dict[str, int]]] = []
-
-    for device, _caps in eligible:
-        score, breakdown = _compute_device_score(device, target, current_time)
-        scored.append((device, score, breakdown))
+    # Highest score wins, then deterministic tie-break. Only the winner is
+    # needed, so take the minimum row instead of sorting.
+    neg_score, _elapsed, _device_id, index = min(rows)
+    winner = candidates[index]
 
-    # Step 3: Sort by score (descending), then deterministic tie-break.
-    scored.sort(key=lambda x: (-x[1], _tie_break_key(x[0], current_time)))
-
-    # Return the winner.
-    winner, winner_score, breakdown = scored[0]
+    # Only the winner's breakdown is reported, so only it is itemized.
+    breakdown: dict[str, int] = {}
+    _compute_device_score(winner, target, current_time, breakdown)
     return SelectionResult(
         device_id=winner.device_id,
-        score=winner_score,
+        score=-neg_score,
         score_breakdown=breakdown,
-        candidates_evaluated=len(eligible),
+        candidates_evaluated=len(candidates),
     )
 
 
@@ -222,45 +300,86 @@ def _compute_device_score(
     device: DeviceContext,
     target: AlertTarget,
     current_time: float,
-) -> tuple[int, dict[str, int]]:
+    breakdown: dict[str, int] | None = None,
+) -> int:
     """Compute selection score for a device.
 
     Args:
         device: Device context to score.
         target: Alert targeting information.
         current_time: Current Unix timestamp.
+        breakdown: If given, filled with the score components.
 
     Returns:
-        Tuple of (total_score, score_breakdown).
+        Total score.
     """
-    score = 0
-    breakdown: dict[str, int] = {}
+    return _compute_room_score(
+        device, target.room_id, breakdown
+    ) + _compute_context_score(device, current_time, breakdown)
+
+
+def _compute_room_score(
+    device: DeviceContext,
+    room_id: str | None,
+    breakdown: dict[str, int] | None = None,
+) -> int:
+    """Compute the target-dependent room score for a device.
+
+    Args:
+        device: Device context to score.
+        room_id: Target room for the alert, if any.
+        breakdown: If given, filled with the room score component.
+
+    Returns:
+        Room score.
+    """
+    if not room_id or not device.room:
+        return 0
 
     # Base score: Room match.
-    if target.room_id and device.room == target.room_id:
-        score += SCORE_ROOM_MATCH
-        breakdown["room_match"] = SCORE_ROOM_MATCH
-    elif target.room_id and device.room:
-        # Same-building fallback (device has a room but not the target room).
-        score += SCORE_SAME_ROOM_FALLBACK
+    if device.room == room_id:
+        if breakdown is not None:
+            breakdown["room_match"] = SCORE_ROOM_MATCH
+        return SCORE_ROOM_MATCH
+
+    # Same-building fallback (device has a room but not the target room).
+    if breakdown is not None:
         breakdown["same_room_fallback"] = SCORE_SAME_ROOM_FALLBACK
+    return SCORE_SAME_ROOM_FALLBACK
+
+
+def _compute_context_score(
+    device: DeviceContext,
+    current_time: float,
+    breakdown: dict[str, int] | None = None,
+) -> int:
+    """Compute the target-independent score for a device.
+
+    Args:
+        device: Device context to score.
+        current_time: Current Unix timestamp.
+        breakdown: If given, filled with the score components.
+
+    Returns:
+        Recency plus signal score.
+    """
+    score = 0
 
     # Base score: Recent interaction.
     if device.last_interaction_ts is not None:
         elapsed = current_time - device.last_interaction_ts
         if 0 <= elapsed < RECENT_INTERACTION_SECONDS:
             score += SCORE_RECENT_INTERACTION
-            breakdown["recent_interaction"] = SCORE_RECENT_INTERACTION
+            if breakdown is not None:
+                breakdown["recent_interaction"] = SCORE_RECENT_INTERACTION
 
     # Signal-based modifiers.
-    signal_score, signal_breakdown = _compute_signal_score(device.signals)
-    score += signal_score
-    breakdown.update(signal_breakdown)
+    return score + _compute_signal_score(device.signals, breakdown)
 
-    return score, breakdown
 
-
-def _compute_signal_score(signals: Mapping[str, Any]) -> tuple[int, dict[str, int]]:
+def _compute_signal_score(
+    signals: Mapping[str, Any], breakdown: dict[str, int] | None = None
+) -> int:
     """Compute score modifiers from device signals.
 
     Missing signals are treated as "unknown" and contribute nothing.
@@ -269,42 +388,48 @@ def _compute_signal_score(signals: Mapping[str, Any]) -> tuple[int, dict[str, in
 
     Args:
         signals: Signal map from device context.
+        breakdown: If given, filled with the signal score components.
 
     Returns:
-        Tuple of (signal_score, signal_breakdown).
+        Signal score.
     """
     score = 0
-    breakdown: dict[str, int] = {}
+    get = signals.get
 
     # Recently active: +40 if True (device-declared user activity).
-    recently_active = signals.get("recently_active")
+    recently_active = get("recently_active")
     if recently_active is True:
         score += SCORE_RECENTLY_ACTIVE
-        breakdown["recently_active"] = SCORE_RECENTLY_ACTIVE
+        if breakdown is not None:
+            breakdown["recently_active"] = SCORE_RECENTLY_ACTIVE
 
     # Proximity active: +30 if True.
-    proximity = signals.get("proximity_active")
+    proximity = get("proximity_active")
     if proximity is True:
         score += SCORE_PROXIMITY_ACTIVE
-        breakdown["proximity_active"] = SCORE_PROXIMITY_ACTIVE
+        if breakdown is not None:
+            breakdown["proximity_active"] = SCORE_PROXIMITY_ACTIVE
 
     # Screen facing: +20 if True.
-    screen_facing = signals.get("screen_facing")
+    screen_facing = get("screen_facing")
     if screen_facing is True:
         score += SCORE_SCREEN_FACING
-        breakdown["screen_facing"] = SCORE_SCREEN_FACING
+        if breakdown is not None:
+            breakdown["screen_facing"] = SCORE_SCREEN_FACING
 
     # Ambient light: boost or penalty based on thresholds.
-    lux = signals.get("ambient_lux")
+    lux = get("ambient_lux")
     if isinstance(lux, int | float):
         if lux < LOW_LUX_THRESHOLD:
             score += SCORE_LOW_LUX_BOOST
-            breakdown["low_lux"] = SCORE_LOW_LUX_BOOST
+            if breakdown is not None:
+                breakdown["low_lux"] = SCORE_LOW_LUX_BOOST
         elif lux > HIGH_LUX_THRESHOLD:
             score += SCORE_HIGH_LUX_PENALTY
-            breakdown["high_lux"] = SCORE_HIGH_LUX_PENALTY
+            if breakdown is not None:
+                breakdown["high_lux"] = SCORE_HIGH_LUX_PENALTY
 
-    return score, breakdown
+    return score
 
 
 def _tie_break_key(device: DeviceContext, current_time: float) -> tuple[float, str]:
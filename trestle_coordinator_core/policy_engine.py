@@ -8,7 +8,7 @@ The output is intent candidates that feed into the existing alert pipeline.
 
 from dataclasses import dataclass, field
 from datetime import datetime, time
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 from .profile import (
@@ -20,30 +20,30 @@ from .profile import (
 )
 
 
-class Importance(Enum):
-    """Intent importance levels (ordered)."""
+class Importance(IntEnum):
+    """Intent importance levels (ordered).
 
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+    Integer-valued so comparisons and max() are plain int compares; the
+    YAML/wire spelling is available as ``label``.
+    """
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
 
     @classmethod
     def from_string(cls, s: str) -> "Importance":
         """Parse importance from string."""
-        return cls(s.lower())
-
-    def __lt__(self, other: "Importance") -> bool:
-        order = [
-            Importance.LOW,
-            Importance.MEDIUM,
-            Importance.HIGH,
-            Importance.CRITICAL,
-        ]
-        return order.index(self) < order.index(other)
+        try:
+            return cls[s.upper()]
+        except KeyError:
+            raise ValueError(f"{s!r} is not a valid Importance") from None
 
-    def __le__(self, other: "Importance") -> bool:
-        return self == other or self < other
+    @property
+    def label(self) -> str:
+        """Lowercase name used in policy files and traces."""
+        return self.name.lower()
 
 
 @dataclass(frozen=True)
@@ -109,24 +109,14 @@ class EvaluationContext:
 
 def _matches_condition(rule: PolicyRule, state: DomainState) -> bool:
     """Check if a rule's 'when' clause matches the domain state."""
-    when = rule.when
-
-    # Domain must match
-    if when.domain != state.domain:
-        return False
-
-    # State match (if specified)
-    if when.state is not None and when.state != state.state:
-        return False
-
-    # Event match (if specified)
-    return when.event is None or when.event == state.event
+    return rule.when.matches(state.domain, state.state, state.event)
 
 
 def _check_conditions(rule: PolicyRule, context: EvaluationContext) -> bool:
     """Check additional conditions (e.g., house_mode: home)."""
-    for domain_name, required_value in rule.conditions.items():
-        domain_state = context.domain_states.get(domain_name)
+    get_state = context.domain_states.get
+    for domain_name, required_value in rule.condition_items:
+        domain_state = get_state(domain_name)
         if domain_state is None:
             return False
         if domain_state.state != required_value:
@@ -136,8 +126,9 @@ def _check_conditions(rule: PolicyRule, context: EvaluationContext) -> bool:
 
 def _check_suppress_if(rule: PolicyRule, context: EvaluationContext) -> str | None:
     """Check suppress_if conditions, return suppression reason if suppressed."""
-    for domain_name, suppress_value in rule.suppress_if.items():
-        domain_state = context.domain_states.get(domain_name)
+    get_state = context.domain_states.get
+    for domain_name, suppress_value in rule.suppress_if_items:
+        domain_state = get_state(domain_name)
         if domain_state is not None and domain_state.state == suppress_value:
             return f"{domain_name}={suppress_value}"
     return None
@@ -171,7 +162,7 @@ def _check_importance_suppression(
         if effect.suppress_below_importance:
             threshold = Importance.from_string(effect.suppress_below_importance)
             if importance < threshold:
-                return f"importance below {threshold.value}"
+                return f"importance below {threshold.label}"
     return None
 
 
@@ -310,10 +301,11 @@ def evaluate_domain_update(
     # Collect active effects first
     context.active_effects = collect_active_effects(policy, context)
 
-    # Evaluate all rules against the updated state
+    # Evaluate the updated domain's rules against the updated state; rules
+    # for other domains can never match it.
     intents: list[IntentCandidate] = []
 
-    for rule in policy.rules:
+    for rule in policy.rules_by_domain.get(updated_state.domain, ()):
         intent = evaluate_rule(rule, updated_state, context, policy.quiet_hours)
         if intent is not None:
             intents.append(intent)
@@ -341,8 +333,10 @@ def evaluate_all_states(
 
     intents: list[IntentCandidate] = []
 
+    rules_by_domain = policy.rules_by_domain
+
     for state in all_states.values():
-        for rule in policy.rules:
+        for rule in rules_by_domain.get(state.domain, ()):
             intent = evaluate_rule(rule, state, context, policy.quiet_hours)
             if intent is not None:
                 intents.append(intent)
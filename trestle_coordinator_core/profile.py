@@ -15,6 +15,12 @@ from typing import Any
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
 
 class DomainScope(Enum):
     """Scope at which a domain operates."""
@@ -76,6 +82,14 @@ class PolicyCondition:
     state: str | None = None
     event: str | None = None
 
+    def matches(self, domain: str, state: str | None, event: str | None) -> bool:
+        """Check whether a domain's current state/event satisfies this clause."""
+        return (
+            self.domain == domain
+            and (self.state is None or self.state == state)
+            and (self.event is None or self.event == event)
+        )
+
 
 @dataclass(frozen=True)
 class PolicyClassification:
@@ -104,6 +118,12 @@ class PolicyRule:
         effects: Side effects to apply.
         conditions: Additional conditions (e.g., house_mode).
         suppress_if: Conditions that suppress this rule.
+        condition_items: ``conditions`` flattened to (domain, value) pairs.
+        suppress_if_items: ``suppress_if`` flattened to (domain, value) pairs.
+
+    The ``*_items`` tuples are derived once at construction so evaluation
+    iterates plain tuples; treat ``conditions`` and ``suppress_if`` as
+    read-only after construction.
     """
 
     rule_id: str
@@ -112,6 +132,17 @@ class PolicyRule:
     effects: PolicyEffects | None = None
     conditions: dict[str, str] = field(default_factory=lambda: {})
     suppress_if: dict[str, str] = field(default_factory=lambda: {})
+    condition_items: tuple[tuple[str, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    suppress_if_items: tuple[tuple[str, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Flatten condition dicts for evaluation."""
+        object.__setattr__(self, "condition_items", tuple(self.conditions.items()))
+        object.__setattr__(self, "suppress_if_items", tuple(self.suppress_if.items()))
 
 
 @dataclass
@@ -121,10 +152,25 @@ class LoadedPolicy:
     Attributes:
         quiet_hours: Quiet hours window (if defined).
         rules: List of policy rules in evaluation order.
+        rules_by_domain: Rules grouped by their 'when' domain, each group in
+            evaluation order. Built at construction, so ``rules`` must not be
+            modified afterwards.
     """
 
     quiet_hours: QuietHours | None
     rules: list[PolicyRule]
+    rules_by_domain: dict[str, tuple[PolicyRule, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index rules by domain for evaluation."""
+        by_domain: dict[str, list[PolicyRule]] = {}
+        for rule in self.rules:
+            by_domain.setdefault(rule.when.domain, []).append(rule)
+        self.rules_by_domain = {
+            domain: tuple(rules) for domain, rules in by_domain.items()
+        }
 
 
 @dataclass
@@ -169,7 +215,7 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise ProfileLoadError(f"File not found: {path}")
     with path.open() as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
 def load_domain(domains_dir: Path, domain_name: str) -> DomainSchema:
@@ -9,11 +9,39 @@ Slice: 8i - Decision Tracing & Explainability
 from __future__ import annotations
 
 import dataclasses
+import itertools
+import os
+import secrets
+import time
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
-from uuid import uuid4
+from typing import Any, overload
+
+# Trace IDs only need to be unique for correlation, so they are a per-process
+# prefix (pid + random salt, guarding against pid reuse) plus a counter
+# instead of a uuid4 read from the OS entropy pool per trace.
+_trace_id_prefix = ""
+_trace_id_counter = itertools.count()
+
+
+def _reset_trace_ids() -> None:
+    global _trace_id_prefix, _trace_id_counter
+    _trace_id_prefix = f"{os.getpid():x}-{secrets.token_hex(4)}-"
+    _trace_id_counter = itertools.count()
+
+
+_reset_trace_ids()
+# Forked children must not repeat the parent's IDs. Platforms without fork
+# (Windows) have no register_at_fork and need no hook.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_trace_ids)
+
+
+def new_trace_id() -> str:
+    """Return a trace ID unique within this process."""
+    return _trace_id_prefix + format(next(_trace_id_counter), "x")
 
 
 class TriggerType(Enum):
@@ -97,15 +125,32 @@ class Trigger:
     source: str | None = None
 
 
+def _from_epoch_ns(ns: int) -> datetime:
+    """Convert epoch nanoseconds to a naive local datetime."""
+    return datetime.fromtimestamp(ns / 1e9)
+
+
 @dataclass
 class DomainSnapshot:
-    """All domain states at decision time."""
+    """All domain states at decision time.
+
+    The snapshot time is stored as epoch nanoseconds (defaulting to the
+    construction time); snapshot_time converts it to a datetime on read, so
+    traces that are never displayed skip the conversion.
+    """
 
-    domains: list[DomainStateEntry]
-    snapshot_time: datetime
+    domains: tuple[DomainStateEntry, ...]
+    snapshot_time_ns: int = field(
+        default_factory=time.time_ns, metadata={"serialize_as": "snapshot_time"}
+    )
     time_of_day: str | None = None
     active_effects: list[ActiveEffect] = field(default_factory=lambda: [])
 
+    @property
+    def snapshot_time(self) -> datetime:
+        """Snapshot time as a naive local datetime."""
+        return _from_epoch_ns(self.snapshot_time_ns)
+
 
 @dataclass
 class ConditionCheck:
@@ -118,6 +163,59 @@ class ConditionCheck:
     actual: str | None = None
 
 
+class FailedConditions(Sequence[str]):
+    """Failed-condition reasons formatted lazily as "domain == expected".
+
+    Most skipped rules are never inspected, so the (domain, expected) pairs
+    are kept as-is and only rendered to strings on first access. Like the
+    list it replaces, it compares equal to a list of the same strings and
+    is unhashable.
+    """
+
+    __slots__ = ("_formatted", "_parts")
+    # Equal to lists, which are unhashable, so it cannot be hashed either.
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, parts: Sequence[tuple[str, str]] = ()) -> None:
+        self._parts = parts
+        self._formatted: list[str] | None = None
+
+    def _strings(self) -> list[str]:
+        if self._formatted is None:
+            self._formatted = [
+                f"{domain} == {expected}" for domain, expected in self._parts
+            ]
+        return self._formatted
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return self._strings()[index]
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings())
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._strings()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FailedConditions):
+            return self._strings() == other._strings()
+        if isinstance(other, list):
+            return self._strings() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._strings())
+
+
 @dataclass
 class IntentClassification:
     """How an intent would be classified."""
@@ -132,7 +230,8 @@ class RuleEvaluation:
     """Evaluation trace for a single rule.
 
     failed_conditions captures explicit no-match reasons, critical for
-    answering "why didn't this fire?" - e.g., ["media_activity == playing"]
+    answering "why didn't this fire?" - e.g., ["media_activity == playing"].
+    It may be a plain list or a FailedConditions view that defers formatting.
     """
 
     rule_id: str
@@ -140,7 +239,7 @@ class RuleEvaluation:
     when_clause: ConditionCheck | None = None
     additional_conditions: list[ConditionCheck] = field(default_factory=lambda: [])
     suppress_if_checks: list[ConditionCheck] = field(default_factory=lambda: [])
-    failed_conditions: list[str] = field(
+    failed_conditions: Sequence[str] = field(
         default_factory=lambda: []
     )  # Explicit no-match reasons
     classification: IntentClassification | None = None
@@ -251,7 +350,7 @@ class DecisionTrace:
     """
 
     trace_id: str
-    timestamp: datetime
+    timestamp_ns: int = field(metadata={"serialize_as": "timestamp"})
     profile_id: str
     trigger: Trigger
     domain_snapshot: DomainSnapshot
@@ -263,17 +362,30 @@ class DecisionTrace:
     home_id: str | None = None
     metrics: PerformanceMetrics | None = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """Trace time as a naive local datetime."""
+        return _from_epoch_ns(self.timestamp_ns)
+
     @classmethod
     def create(
         cls,
         profile_id: str,
         trigger: Trigger,
         domain_snapshot: DomainSnapshot,
+        clock: Callable[[], int] = time.time_ns,
     ) -> DecisionTrace:
-        """Create a new trace with auto-generated ID and timestamp."""
+        """Create a new trace with auto-generated ID and timestamp.
+
+        Args:
+            profile_id: Profile that was evaluated
+            trigger: What initiated the decision
+            domain_snapshot: Domain states at decision time
+            clock: Wall clock returning epoch nanoseconds
+        """
         return cls(
-            trace_id=str(uuid4()),
-            timestamp=datetime.now(),
+            trace_id=new_trace_id(),
+            timestamp_ns=clock(),
             profile_id=profile_id,
             trigger=trigger,
             domain_snapshot=domain_snapshot,
@@ -295,13 +407,15 @@ def _to_dict(obj: object) -> str | list[object] | dict[str, object] | object:
         return str(obj.value)
     if isinstance(obj, datetime):
         return obj.isoformat()
-    if isinstance(obj, list):
+    if isinstance(obj, list | tuple | FailedConditions):
         return [_to_dict(item) for item in obj]  # pyright: ignore[reportUnknownArgumentType,reportUnknownVariableType]
     if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
         result: dict[str, object] = {}
         for f in dataclasses.fields(obj):
-            value = getattr(obj, f.name)
+            # Epoch-ns fields serialize through their datetime property.
+            name = f.metadata.get("serialize_as", f.name)
+            value = getattr(obj, name)
             if value is not None:
-                result[f.name] = _to_dict(value)
+                result[name] = _to_dict(value)
         return result
     return obj
@@ -15,18 +15,14 @@ from __future__ import annotations
 import secrets
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import time as dt_time
+from functools import lru_cache
+from itertools import islice
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
-from .policy_engine import (
-    DomainState,
-    EvaluationContext,
-    Importance,
-    IntentCandidate,
-)
 from .trace import (
     ArbitrationTrace,
     ConditionCheck,
@@ -34,6 +30,7 @@ from .trace import (
     DecisionTrace,
     DomainSnapshot,
     DomainStateEntry,
+    FailedConditions,
     IntentClassification,
     OutcomeType,
     PerformanceMetrics,
@@ -44,9 +41,15 @@ from .trace import (
     Trigger,
     TriggerType,
     WinningIntent,
+    new_trace_id,
 )
 
 if TYPE_CHECKING:
+    from .policy_engine import (
+        DomainState,
+        EvaluationContext,
+        IntentCandidate,
+    )
     from .profile import PolicyRule
 
 
@@ -105,17 +108,15 @@ class NullEmitter(TraceEmitter):
 class BufferEmitter(TraceEmitter):
     """In-memory buffer for testing and dev tools.
 
-    Stores traces in a bounded buffer (FIFO eviction).
+    Stores traces in a bounded ring buffer (FIFO eviction).
     """
 
     def __init__(self, max_size: int = 1000) -> None:
-        self._buffer: list[DecisionTrace] = []
+        self._buffer: deque[DecisionTrace] = deque(maxlen=max_size)
         self._max_size = max_size
 
     def emit(self, trace: DecisionTrace) -> None:
         """Add trace to buffer, evicting oldest if full."""
-        if len(self._buffer) >= self._max_size:
-            self._buffer.pop(0)
         self._buffer.append(trace)
 
     @property
@@ -128,8 +129,16 @@ class BufferEmitter(TraceEmitter):
         self._buffer.clear()
 
     def last(self, n: int = 1) -> list[DecisionTrace]:
-        """Get the last N traces."""
-        return self._buffer[-n:]
+        """Get the last N traces (oldest first).
+
+        Walks the buffer from the right, so the cost is O(n) rather than
+        a copy of the whole buffer.
+        """
+        if n <= 0:
+            return []
+        newest_first = list(islice(reversed(self._buffer), n))
+        newest_first.reverse()
+        return newest_first
 
 
 class CallbackEmitter(TraceEmitter):
@@ -165,6 +174,7 @@ class TraceBuilder:
     trigger: Trigger
     domain_snapshot: DomainSnapshot
     config: TraceConfig = field(default_factory=TraceConfig)
+    clock: Callable[[], int] = time.time_ns  # Wall clock, epoch nanoseconds
 
     # Timing (microseconds)
     _start_time_ns: int = field(default_factory=time.perf_counter_ns)
@@ -284,8 +294,8 @@ class TraceBuilder:
         )
 
         return DecisionTrace(
-            trace_id=str(uuid4()),
-            timestamp=datetime.now(),
+            trace_id=new_trace_id(),
+            timestamp_ns=self.clock(),
             decision_id=self._decision_id,
             parent_decision_id=self._parent_decision_id,
             profile_id=self.profile_id,
@@ -317,12 +327,24 @@ def build_trigger_from_state(
     )
 
 
+@lru_cache(maxsize=1440)
+def _format_hhmm(hour: int, minute: int) -> str:
+    """Format a time of day as "HH:MM" (one cache entry per minute)."""
+    return f"{hour:02d}:{minute:02d}"
+
+
 def build_domain_snapshot(
     all_states: dict[str, DomainState],
-    current_time: str,
+    current_time: dt_time | str,
+    clock: Callable[[], int] = time.time_ns,
 ) -> DomainSnapshot:
-    """Build a DomainSnapshot from current domain states."""
-    entries = [
+    """Build a DomainSnapshot from current domain states.
+
+    The snapshot is stamped with clock() (epoch nanoseconds); the datetime
+    form is only built if snapshot_time is read. current_time may be a
+    datetime.time, which is recorded as "HH:MM".
+    """
+    entries = tuple(
         DomainStateEntry(
             domain=state.domain,
             state=state.state or "",
@@ -330,11 +352,14 @@ def build_domain_snapshot(
             metadata=state.metadata if state.metadata else None,
         )
         for state in all_states.values()
-    ]
+    )
+
+    if isinstance(current_time, dt_time):
+        current_time = _format_hhmm(current_time.hour, current_time.minute)
 
     return DomainSnapshot(
         domains=entries,
-        snapshot_time=datetime.now(),
+        snapshot_time_ns=clock(),
         time_of_day=current_time,
     )
 
@@ -349,13 +374,8 @@ def trace_rule_evaluation(
 
     Captures the full reasoning chain including failed conditions.
     """
-    # Check when clause (inline logic to avoid private import)
-    when = rule.when
-    when_satisfied = (
-        when.domain == state.domain
-        and (when.state is None or when.state == state.state)
-        and (when.event is None or when.event == state.event)
-    )
+    # Check when clause
+    when_satisfied = rule.when.matches(state.domain, state.state, state.event)
     when_clause = ConditionCheck(
         condition_type="when",
         domain=rule.when.domain,
@@ -364,8 +384,9 @@ def trace_rule_evaluation(
         satisfied=when_satisfied,
     )
 
-    # Collect failed conditions
-    failed_conditions: list[str] = []
+    # Collect failed conditions as (domain, expected) pairs; formatting is
+    # deferred to FailedConditions since most skipped rules are never read.
+    failed_conditions: list[tuple[str, str]] = []
     additional_conditions: list[ConditionCheck] = []
 
     # Check additional conditions
@@ -387,7 +408,7 @@ def trace_rule_evaluation(
 
         if not satisfied:
             conditions_satisfied = False
-            failed_conditions.append(f"{domain_name} == {required_value}")
+            failed_conditions.append((domain_name, required_value))
 
     # Check suppress_if
     suppress_if_checks: list[ConditionCheck] = []
@@ -412,7 +433,7 @@ def trace_rule_evaluation(
         result = RuleResult.SKIPPED
         skip_reason = f"when clause not satisfied: {rule.when.domain}"
         failed_conditions.insert(
-            0, f"{rule.when.domain} == {rule.when.state or rule.when.event}"
+            0, (rule.when.domain, str(rule.when.state or rule.when.event))
         )
     elif not conditions_satisfied:
         result = RuleResult.SKIPPED
@@ -442,7 +463,9 @@ def trace_rule_evaluation(
         when_clause=when_clause,
         additional_conditions=additional_conditions,
         suppress_if_checks=suppress_if_checks,
-        failed_conditions=failed_conditions if result == RuleResult.SKIPPED else [],
+        failed_conditions=FailedConditions(failed_conditions)
+        if result == RuleResult.SKIPPED
+        else [],
         classification=classification,
         skip_reason=skip_reason,
         suppress_reason=intent.suppression_reason
@@ -466,23 +489,12 @@ def determine_outcome(
         return OutcomeType.SUPPRESSED, None
 
     # Pick highest importance (simple arbitration)
-    winner = max(
-        active,
-        key=lambda i: (
-            [
-                Importance.LOW,
-                Importance.MEDIUM,
-                Importance.HIGH,
-                Importance.CRITICAL,
-            ].index(i.importance),
-            i.interrupt,
-        ),
-    )
+    winner = max(active, key=lambda i: (i.importance, i.interrupt))
 
     return OutcomeType.INTENT_GENERATED, WinningIntent(
         domain=winner.domain,
         rule_id=winner.rule_id,
-        importance=winner.importance.value,
+        importance=winner.importance.label,
         interrupt=winner.interrupt,
         scope_id=winner.scope_id,
     )
@@ -11,18 +11,55 @@ Components:
 - protobuf_util: Protobuf serialization helpers
 """
 
-from .http import TrestleHttpClient
-from .protocol import (
-    build_auth_confirmed,
-    build_auth_invalid,
-    build_auth_ok,
-    build_envelope,
-    build_time_body,
-    parse_auth_ok,
-)
-from .session import TrestleSession
-from .ws import connect_websocket
-from .ws_client import TrestleWsClient, TrestleWsMessage, TrestleWsMessageType
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .http import TrestleHttpClient
+    from .protocol import (
+        build_auth_confirmed,
+        build_auth_invalid,
+        build_auth_ok,
+        build_envelope,
+        build_time_body,
+        parse_auth_ok,
+    )
+    from .session import TrestleSession
+    from .ws import connect_websocket
+    from .ws_client import TrestleWsClient, TrestleWsMessage, TrestleWsMessageType
+
+# Exports are resolved on first access (PEP 562) so that importing one
+# submodule does not pull in the others; http alone costs an aiohttp import.
+_EXPORTS: dict[str, str] = {
+    "TrestleHttpClient": "http",
+    "TrestleSession": "session",
+    "TrestleWsClient": "ws_client",
+    "TrestleWsMessage": "ws_client",
+    "TrestleWsMessageType": "ws_client",
+    "build_auth_confirmed": "protocol",
+    "build_auth_invalid": "protocol",
+    "build_auth_ok": "protocol",
+    "build_envelope": "protocol",
+    "build_time_body": "protocol",
+    "connect_websocket": "ws",
+    "parse_auth_ok": "protocol",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
+
 
 __all__ = [
     "TrestleHttpClient",
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Final
+import asyncio
+import random
+from collections.abc import Awaitable, Callable, Mapping
+from functools import partial
+from types import MappingProxyType
+from typing import Final, TypeVar
 
 import aiohttp
 
+from .._json import json_loads
 from ..errors import (
     TrestleConnectionError,
     TrestleResponseError,
@@ -15,9 +21,56 @@ from ..errors import (
 # Sentinel value to explicitly request no authentication
 _NO_AUTH: Final = object()
 
+# Per-endpoint request timeouts (ClientTimeout is immutable, so shared).
+_INFO_TIMEOUT: Final = aiohttp.ClientTimeout(total=5)
+_PAIR_TIMEOUT: Final = aiohttp.ClientTimeout(total=20)
+_UNPAIR_TIMEOUT: Final = aiohttp.ClientTimeout(total=10)
+_SCREENSHOT_TIMEOUT: Final = aiohttp.ClientTimeout(total=5)
+
+# Connection pool settings for build_shared_session. Panels are polled far
+# more often than aiohttp's 15s default keep-alive, so idle sockets are kept
+# for a minute; a few connections per panel is plenty.
+_POOL_LIMIT: Final = 100
+_POOL_LIMIT_PER_HOST: Final = 4
+_POOL_KEEPALIVE_TIMEOUT: Final = 60
+
+# Failures worth retrying. A connect error means the request never reached
+# the device, so it is safe to retry for any endpoint; a timeout may have
+# been processed, so it is only retried for idempotent requests.
+_RETRY_CONNECT: Final[tuple[type[Exception], ...]] = (aiohttp.ClientConnectorError,)
+_RETRY_TRANSIENT: Final[tuple[type[Exception], ...]] = (
+    TimeoutError,
+    aiohttp.ClientConnectorError,
+)
+
+_T = TypeVar("_T")
+
 
 class TrestleHttpClient:
-    """HTTP client wrapper for RockBridge Trestle device endpoints."""
+    """HTTP client wrapper for RockBridge Trestle device endpoints.
+
+    The client does not own its session. Pass one long-lived session shared
+    by every device client (for example from build_shared_session) so
+    requests reuse pooled keep-alive connections instead of opening a new
+    TCP connection each time.
+    """
+
+    @staticmethod
+    def build_shared_session() -> aiohttp.ClientSession:
+        """Create a pooled session suitable for sharing across devices.
+
+        Must be called from a running event loop. The caller owns the
+        session and closes it when the coordinator shuts down.
+
+        Returns:
+            ClientSession with a keep-alive TCP connector.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=_POOL_LIMIT,
+            limit_per_host=_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=_POOL_KEEPALIVE_TIMEOUT,
+        )
+        return aiohttp.ClientSession(connector=connector)
 
     def __init__(
         self,
@@ -26,29 +79,75 @@ class TrestleHttpClient:
         port: int,
         *,
         secret: str | None = None,
+        request_attempts: int = 1,
+        retry_base_delay: float = 0.2,
+        retry_max_delay: float = 2.0,
     ) -> None:
+        """Initialize client.
+
+        Args:
+            session: Shared aiohttp session (see build_shared_session).
+            host: Device hostname or IP
+            port: Device port
+            secret: Pairing secret used as Bearer token, if paired
+            request_attempts: Attempts per request on transient failures;
+                the default of 1 disables retries
+            retry_base_delay: Base retry delay (seconds)
+            retry_max_delay: Maximum retry delay (seconds)
+        """
         self._session = session
         self._host = host
         self._port = port
         self._secret = secret
+        self._request_attempts = max(request_attempts, 1)
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        # Both are fixed for the client's lifetime; build them once. The
+        # headers are shared by every request, so they are read-only.
+        self._base_url = f"http://{host}:{port}"
+        self._secret_headers = MappingProxyType(self._bearer_headers(secret))
 
     def _url(self, path: str) -> str:
-        return f"http://{self._host}:{self._port}{path}"
+        return self._base_url + path
 
-    def _auth_headers(self, secret: str | None | object = None) -> dict[str, str]:
+    def _auth_headers(self, secret: str | None | object = None) -> Mapping[str, str]:
         # Check for explicit no-auth sentinel
         if secret is _NO_AUTH:
             return {}
-        token = secret if secret is not None else self._secret
+        if secret is None:
+            return self._secret_headers
+        return self._bearer_headers(secret)
+
+    @staticmethod
+    def _bearer_headers(token: object) -> dict[str, str]:
         if not token:
             return {}
         return {"Authorization": f"Bearer {token}"}
 
+    async def _with_retries(
+        self,
+        attempt: Callable[[], Awaitable[_T]],
+        retry_on: tuple[type[Exception], ...],
+    ) -> _T:
+        """Run a request attempt, retrying transient failures.
+
+        Retries use exponential backoff with full jitter so many panels
+        failing together do not retry in lockstep. HTTP status codes are
+        never retried; the last failure propagates to the caller.
+        """
+        for retry in range(self._request_attempts - 1):
+            try:
+                return await attempt()
+            except retry_on:
+                cap = min(self._retry_max_delay, self._retry_base_delay * 2**retry)
+                # Jitter only spreads load; it needs no cryptographic randomness.
+                await asyncio.sleep(random.uniform(0, cap))  # noqa: S311
+        return await attempt()
+
     async def fetch_device_id(
         self,
         *,
         retry_without_auth: bool = True,
-        _secret_override: str | None | object = None,
     ) -> str | None:
         """Fetch device-provided unique ID from /api/info endpoint.
 
@@ -61,60 +160,68 @@ class TrestleHttpClient:
         Args:
             retry_without_auth: If True and 401 received, retry without auth
                 after unpair attempt.
-            _secret_override: Internal parameter for retry logic.
 
         Returns:
             Device ID string, or None if request failed.
         """
         url = self._url("/api/info")
-        # Use override if provided, otherwise use instance secret
-        if _secret_override is not None:
-            headers = self._auth_headers(_secret_override)
-        else:
-            headers = self._auth_headers()
 
-        try:
+        async def get_info(secret: object) -> tuple[int, str | None]:
             async with self._session.get(
                 url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=5),
+                headers=self._auth_headers(secret),
+                timeout=_INFO_TIMEOUT,
             ) as resp:
-                # ICD 3.1: After pairing, device SHALL return 401 if token missing/invalid
-                if resp.status == 401 and self._secret and retry_without_auth:
-                    # Device rejected auth - orphan panel scenario (ICD 3.2)
-                    # Unpair device to force back to unpaired state
-                    await self.unpair_device()
-
-                    # Retry without auth
-                    return await self.fetch_device_id(
-                        retry_without_auth=False, _secret_override=_NO_AUTH
-                    )
-
                 if resp.status != 200:
-                    return None
-                data = await resp.json()
-                result: str | None = (
+                    return resp.status, None
+                data = await resp.json(loads=json_loads)
+                device_id: str | None = (
                     data.get("id") or data.get("unique_id") or data.get("device_id")
                 )
-                return result
+                return resp.status, device_id
+
+        try:
+            status, device_id = await self._with_retries(
+                partial(get_info, None), _RETRY_TRANSIENT
+            )
+
+            # ICD 3.1: After pairing, device SHALL return 401 if token
+            # missing/invalid
+            if status == 401 and self._secret and retry_without_auth:
+                # Device rejected auth - orphan panel scenario (ICD 3.2)
+                # Unpair device to force back to unpaired state
+                await self.unpair_device()
+
+                # Retry without auth
+                status, device_id = await self._with_retries(
+                    partial(get_info, _NO_AUTH), _RETRY_TRANSIENT
+                )
         except TimeoutError as err:
             raise TrestleTimeout("Device info request timed out") from err
         except aiohttp.ClientError as err:
             raise TrestleConnectionError("Failed to fetch device info") from err
 
+        return device_id
+
     async def send_pairing_secret(self, secret: str) -> None:
         """Send pairing secret to /pair endpoint."""
         url = self._url("/pair")
-        try:
+
+        async def post_pair() -> None:
             async with self._session.post(
                 url,
                 json={"secret": secret},
-                timeout=aiohttp.ClientTimeout(total=20),
+                timeout=_PAIR_TIMEOUT,
             ) as resp:
                 if resp.status != 200:
                     raise TrestleResponseError(
                         resp.status, "Pairing failed with non-200 response"
                     )
+
+        try:
+            # Pairing is not retried after a timeout: the device may already
+            # have stored the secret.
+            await self._with_retries(post_pair, _RETRY_CONNECT)
         except TimeoutError as err:
             raise TrestleTimeout("Pairing request timed out") from err
         except aiohttp.ClientError as err:
@@ -138,10 +245,11 @@ class TrestleHttpClient:
             TrestleConnectionError: If network request fails
         """
         url = self._url("/api/unpair")
-        try:
+
+        async def post_unpair() -> None:
             async with self._session.post(
                 url,
-                timeout=aiohttp.ClientTimeout(total=10),
+                timeout=_UNPAIR_TIMEOUT,
             ) as resp:
                 # ICD 3.2.1: Device SHALL return 200 with body "OK"
                 if resp.status != 200:
@@ -149,6 +257,10 @@ class TrestleHttpClient:
                         resp.status,
                         "Unpair failed - device must return 200 OK per ICD 3.2",
                     )
+
+        try:
+            # Unpair is idempotent (ICD 3.2), so timeouts are retried too.
+            await self._with_retries(post_unpair, _RETRY_TRANSIENT)
         except TimeoutError as err:
             raise TrestleTimeout("Unpair request timed out") from err
         except aiohttp.ClientError as err:
@@ -158,17 +270,21 @@ class TrestleHttpClient:
         """Fetch device screenshot from /api/screenshot endpoint."""
         url = self._url("/api/screenshot")
         headers = self._auth_headers(secret)
-        try:
+
+        async def get_screenshot() -> tuple[bytes, str] | None:
             async with self._session.get(
                 url,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=5),
+                timeout=_SCREENSHOT_TIMEOUT,
             ) as resp:
                 if resp.status != 200:
                     return None
                 image_data = await resp.read()
                 content_type = resp.headers.get("Content-Type", "image/png")
                 return image_data, content_type
+
+        try:
+            return await self._with_retries(get_screenshot, _RETRY_TRANSIENT)
         except TimeoutError as err:
             raise TrestleTimeout("Screenshot request timed out") from err
         except aiohttp.ClientError as err:
@@ -32,6 +32,10 @@ async def connect_websocket(
     Uses the websockets library which properly implements RFC 6455 frame masking.
     All client-to-server frames are automatically masked per the standard.
 
+    The returned connection is the websockets>=14 asyncio implementation: an
+    asyncio.Protocol that feeds received bytes straight into the Sans-IO
+    protocol parser, with no StreamReader buffering in between.
+
     Args:
         host: Target host
         port: Target port
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import socket
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import ConnectionClosed
 
+from .._json import json_dumps, json_loads
 from ..errors import TrestleClientError, TrestleConnectionError
 from .ws import connect_websocket
 
@@ -19,7 +20,10 @@ except ImportError:  # pragma: no cover
     WSMsgType = None
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+# Linux-only; elsewhere send_batch() simply writes the frames back-to-back.
+_TCP_CORK: int | None = getattr(socket, "TCP_CORK", None)
 
 
 class TrestleWsMessageType(Enum):
@@ -30,12 +34,47 @@ class TrestleWsMessageType(Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrestleWsMessage:
     """Normalized WebSocket message payload."""
 
     type: TrestleWsMessageType
-    data: str | dict[str, Any] | None = None
+    data: str | bytes | dict[str, Any] | None = None
+
+
+# Payload-free terminal messages are immutable, so share one instance each.
+_CLOSED_MSG = TrestleWsMessage(TrestleWsMessageType.CLOSED)
+_ERROR_MSG = TrestleWsMessage(TrestleWsMessageType.ERROR)
+
+
+def _normalize_text(msg: str) -> TrestleWsMessage:
+    return TrestleWsMessage(TrestleWsMessageType.TEXT, msg)
+
+
+def _drop_binary(msg: bytes | bytearray) -> None:
+    return None
+
+
+# Exact-type fast path for the frames websockets yields; anything else
+# (aiohttp WSMessage, str subclasses, ...) goes through attribute probing.
+_NORMALIZERS: dict[type, Callable[[Any], TrestleWsMessage | None]] = {
+    str: _normalize_text,
+    bytes: _drop_binary,
+    bytearray: _drop_binary,
+}
+
+_AIOHTTP_TYPES: dict[Any, TrestleWsMessageType | None] = (
+    {}
+    if WSMsgType is None
+    else {
+        WSMsgType.TEXT: TrestleWsMessageType.TEXT,
+        WSMsgType.BINARY: None,
+        WSMsgType.CLOSE: TrestleWsMessageType.CLOSED,
+        WSMsgType.CLOSING: TrestleWsMessageType.CLOSED,
+        WSMsgType.CLOSED: TrestleWsMessageType.CLOSED,
+        WSMsgType.ERROR: TrestleWsMessageType.ERROR,
+    }
+)
 
 
 class TrestleWsClient:
@@ -43,6 +82,7 @@ class TrestleWsClient:
 
     def __init__(self) -> None:
         self._ws: ClientConnection | None = None
+        self._messages: AsyncIterator[TrestleWsMessage] | None = None
 
     async def connect(
         self,
@@ -62,6 +102,7 @@ class TrestleWsClient:
             ping_interval: Interval for ping frames
             timeout: Connection timeout
         """
+        self._messages = None
         self._ws = await connect_websocket(
             host,
             port,
@@ -76,10 +117,43 @@ class TrestleWsClient:
             await self._ws.close()
 
     async def send_json(self, payload: dict[str, Any]) -> None:
-        """Send a JSON payload to the websocket."""
+        """Send a JSON payload to the websocket.
+
+        The payload is encoded straight to UTF-8 bytes and sent as a TEXT
+        frame, so websockets does not re-encode it.
+        """
+        if self._ws is None:
+            raise TrestleConnectionError("WebSocket is not connected")
+        await self._ws.send(json_dumps(payload), text=True)
+
+    async def send_batch(self, payloads: Iterable[dict[str, Any]]) -> None:
+        """Send several JSON payloads back-to-back.
+
+        All payloads are encoded before the first write. Where TCP_CORK is
+        available the socket is corked for the duration, so the kernel
+        coalesces the frames into full segments instead of one small
+        packet per frame.
+
+        Args:
+            payloads: JSON payloads to send, in order
+
+        Raises:
+            TrestleConnectionError: If not connected
+        """
         if self._ws is None:
             raise TrestleConnectionError("WebSocket is not connected")
-        await self._ws.send(json.dumps(payload))
+        frames = [json_dumps(payload) for payload in payloads]
+        if not frames:
+            return
+
+        sock = self._ws.transport.get_extra_info("socket")
+        corked = _set_cork(sock, True)
+        try:
+            for frame in frames:
+                await self._ws.send(frame, text=True)
+        finally:
+            if corked:
+                _set_cork(sock, False)
 
     async def send_bytes(self, data: bytes) -> None:
         """Send binary data to the websocket.
@@ -99,10 +173,22 @@ class TrestleWsClient:
             raise TrestleConnectionError("WebSocket is not connected")
         return self._iter_messages()
 
+    async def __anext__(self) -> TrestleWsMessage:
+        """Return the next normalized message from the shared iterator.
+
+        Raises:
+            TrestleConnectionError: If not connected
+            StopAsyncIteration: After the terminal CLOSED/ERROR message
+        """
+        if self._messages is None:
+            self._messages = self.__aiter__()
+        return await anext(self._messages)
+
     async def _iter_messages(self) -> AsyncIterator[TrestleWsMessage]:
         if self._ws is None:
             raise TrestleConnectionError("WebSocket is not connected")
 
+        # A single try around the whole loop: no per-frame handler setup.
         try:
             async for msg in self._ws:
                 normalized: TrestleWsMessage | None = self._normalize_message(msg)
@@ -110,61 +196,65 @@ class TrestleWsClient:
                     continue
                 yield normalized
         except ConnectionClosed:
-            yield TrestleWsMessage(type=TrestleWsMessageType.CLOSED)
+            yield _CLOSED_MSG
         except Exception:
-            yield TrestleWsMessage(type=TrestleWsMessageType.ERROR)
+            yield _ERROR_MSG
         else:
             # Normal iteration completion means the peer closed gracefully.
-            yield TrestleWsMessage(type=TrestleWsMessageType.CLOSED)
+            yield _CLOSED_MSG
 
     @staticmethod
     def _normalize_message(msg: Any) -> TrestleWsMessage | None:
         """Normalize backend-specific frames into TrestleWsMessage."""
+        normalizer = _NORMALIZERS.get(type(msg))
+        if normalizer is not None:
+            return normalizer(msg)
         if isinstance(msg, bytes):
             return None
-        if isinstance(msg, str):
-            return TrestleWsMessage(TrestleWsMessageType.TEXT, msg)
-
-        msg_type = getattr(msg, "type", None)
-        data = getattr(msg, "data", None)
 
-        if WSMsgType is not None and msg_type is not None:
-            normalized_type: TrestleWsMessageType | None = (
-                TrestleWsClient._map_aiohttp_type(msg_type)
-            )
-            if normalized_type is None:
+        if WSMsgType is not None:
+            try:
+                msg_type = msg.type
+            except AttributeError:
+                msg_type = None
+            if msg_type is not None:
+                normalized_type = _AIOHTTP_TYPES.get(msg_type)
+                if normalized_type is TrestleWsMessageType.TEXT:
+                    return TrestleWsMessage(normalized_type, msg.data)
+                if normalized_type is TrestleWsMessageType.CLOSED:
+                    return _CLOSED_MSG
+                if normalized_type is TrestleWsMessageType.ERROR:
+                    return _ERROR_MSG
                 return None
-            return TrestleWsMessage(normalized_type, data)
 
         # Fallback: treat unknown objects as text via their string repr
         return TrestleWsMessage(TrestleWsMessageType.TEXT, str(msg))
 
     @staticmethod
-    def _map_aiohttp_type(msg_type: Any) -> TrestleWsMessageType | None:
-        """Map aiohttp WSMsgType enums to internal message types."""
-        if WSMsgType is None:
-            return None
-
-        if msg_type is WSMsgType.TEXT:
-            return TrestleWsMessageType.TEXT
-
-        if msg_type is WSMsgType.BINARY:
-            return None
-
-        if msg_type in {WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED}:
-            return TrestleWsMessageType.CLOSED
-
-        if msg_type is WSMsgType.ERROR:
-            return TrestleWsMessageType.ERROR
+    def decode_json(message: TrestleWsMessage) -> dict[str, Any]:
+        """Decode a TEXT message payload into JSON.
 
-        return None
+        The payload may be a str or raw UTF-8 bytes; bytes are parsed
+        directly, without decoding to str first.
 
-    @staticmethod
-    def decode_json(message: TrestleWsMessage) -> dict[str, Any]:
-        """Decode a TEXT message payload into JSON."""
+        Raises:
+            TrestleClientError: If the message is not TEXT or not str/bytes.
+            json.JSONDecodeError: If the payload is not valid JSON.
+        """
         if message.type is not TrestleWsMessageType.TEXT:
             raise TrestleClientError("Only TEXT messages can be decoded")
-        if not isinstance(message.data, str):
-            raise TrestleClientError("Message data is not a string")
-        result: dict[str, Any] = json.loads(message.data)
+        if not isinstance(message.data, str | bytes):
+            raise TrestleClientError("Message data is not a string or bytes")
+        result: dict[str, Any] = json_loads(message.data)
         return result
+
+
+def _set_cork(sock: Any, enabled: bool) -> bool:
+    """Set TCP_CORK on sock, returning whether the option was applied."""
+    if _TCP_CORK is None or sock is None:
+        return False
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, int(enabled))
+    except OSError:
+        return False
+    return True